@@ -23,6 +23,7 @@ from bot.services.region_service import region_service
 from bot.services.number_service import number_service, number_cache
 from bot.services.account_service import account_cache
 from bot.services.email_service import email_cache
+from bot.services.stats_cache import stats_cache
 from bot.keyboards.number_keyboards import get_number_today_mode_keyboard
 from bot.keyboards.inline import (
     get_buffer_clear_category_keyboard,
@@ -564,6 +565,9 @@ async def buffer_clear_confirm(
 
     await state.clear()
 
+    # Буфер записи мог быть очищен — закэшированная статистика больше не актуальна
+    stats_cache.invalidate()
+
     resource_name = RESOURCE_NAMES.get(resource, resource)
     type_name = CLEAR_TYPE_NAMES.get(clear_type, clear_type)
 
@@ -1,9 +1,18 @@
+import asyncio
 import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
 
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
-from aiogram.filters import Command
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
+from aiogram.filters import Command, StateFilter
 from aiogram.fsm.context import FSMContext
+from aiogram.fsm.state import State
 
 from bot.states.states import StatisticStates
 from bot.keyboards.callbacks import (
@@ -25,6 +34,7 @@ from bot.keyboards.inline import (
     get_stat_back_to_region_keyboard,
     get_stat_period_keyboard,
     get_stat_detailed_keyboard,
+    get_stat_back_to_menu_keyboard,
     # Email keyboards
     get_stat_email_resource_keyboard,
     get_stat_email_type_keyboard,
@@ -37,16 +47,198 @@ from bot.keyboards.inline import (
     get_stat_number_period_keyboard,
 )
 from bot.models.enums import Resource, Gender, EmailResource
-from bot.services.sheets_service import sheets_service, NumberStatistics
+from bot.services.sheets_service import sheets_service, AccountStatistics, NumberStatistics
 from bot.services.region_service import region_service
+from bot.services.stats_cache import stats_cache, ttl_for_period
 
 logger = logging.getLogger(__name__)
 router = Router()
 
+# Методы сервисов-синглтонов, связанные один раз при импорте
+_get_statistics = sheets_service.get_statistics
+_get_statistics_by_regions = sheets_service.get_statistics_by_regions
+_get_statistics_with_regions = sheets_service.get_statistics_with_regions
+_get_email_statistics = sheets_service.get_email_statistics
+_get_number_statistics = sheets_service.get_number_statistics
+_get_regions_tuple = region_service.get_regions_tuple
+_get_regions_frozenset = region_service.get_regions_frozenset
+
+# Статичные клавиатуры строим один раз при импорте: объекты общие, их нельзя изменять.
+# Клавиатуры регионов зависят от списка регионов и берутся через функции.
+_RESOURCE_KB = get_stat_resource_keyboard()
+_BACK_TO_MENU_KB = get_stat_back_to_menu_keyboard()
+_EMAIL_RESOURCE_KB = get_stat_email_resource_keyboard()
+_EMAIL_TYPE_KB = get_stat_email_type_keyboard()
+
+# Поиск enum по значению из callback_data (dict вместо Enum.__call__)
+_RES_BY_VALUE = {r.value: r for r in Resource}
+_GENDER_BY_VALUE = {g.value: g for g in Gender}
+_EMAIL_BY_VALUE = {e.value: e for e in EmailResource}
+
+# Длительность последних запросов статистики к Sheets (секунды).
+# Если запросы быстрые — не тратим лишний edit_text на "Загрузка..."
+# (лимит Telegram ~30 сообщений/сек на бота).
+_SHEETS_LATENCY: deque = deque(maxlen=32)
+_LOADING_THRESHOLD = 0.5  # P95 выше этого значения — показываем загрузку
+
+
+def _sheets_p95() -> float:
+    """P95 длительности запросов статистики (inf, пока окно не заполнено)"""
+    if len(_SHEETS_LATENCY) < _SHEETS_LATENCY.maxlen:
+        return float("inf")
+    return sorted(_SHEETS_LATENCY)[int(len(_SHEETS_LATENCY) * 0.95)]
+
+
+def _need_loading_placeholder(key: Hashable) -> bool:
+    """Нужно ли показывать "Загрузка статистики..." перед запросом (результата нет в кэше)"""
+    return not stats_cache.contains(key) and _sheets_p95() > _LOADING_THRESHOLD
+
+
+# Запросы статистики в полёте: одинаковые параллельные запросы ждут один вызов Sheets
+_inflight: Dict[Hashable, asyncio.Task] = {}
+
+
+async def _single_flight(key: Hashable, fetch: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+    """Выполнить fetch(**kwargs) один раз на ключ, остальные вызовы ждут тот же результат"""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch(**kwargs))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # shield: отмена одного ожидающего не отменяет запрос для остальных
+    return await asyncio.shield(task)
+
+
+async def _cached_fetch(key: Hashable, fetch: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+    """
+    Результат статистики из кэша, иначе один запрос к Sheets (с замером длительности).
+
+    fetch вызывается с raise_errors=True: при ошибке Sheets исключение уходит
+    в хэндлер (сообщение об ошибке), а в кэш попадает только успешный результат.
+    """
+    cached = stats_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async def timed_fetch() -> Any:
+        # Замер внутри задачи single-flight: длительность пишет только тот,
+        # кто реально ходит в Sheets, а не каждый ожидающий
+        t0 = time.monotonic()
+        result = await fetch(raise_errors=True, **kwargs)
+        _SHEETS_LATENCY.append(time.monotonic() - t0)
+        return result
+
+    result = await _single_flight(key, timed_fetch)
+    stats_cache.set(key, result, ttl=ttl_for_period(kwargs["period"]))
+    return result
+
+
+async def _fetch_all_regions_overview(
+    resource: Resource,
+    gender: Gender,
+    regions: Tuple[str, ...],
+    period: str,
+    raise_errors: bool = False,
+) -> AccountStatistics:
+    """
+    Сводка по всем регионам для аккаунтов. Детальная статистика по регионам
+    считается из того же чтения листа и сразу кладётся в кэш — кнопка
+    "Детальнее" открывается без второго запроса к Sheets.
+
+    С raise_errors=True ошибка чтения пробрасывается, и в кэш не попадает
+    ни сводка, ни детальная статистика.
+    """
+    total, by_region = await _get_statistics_with_regions(
+        resource=resource, gender=gender, regions=regions, period=period,
+        raise_errors=raise_errors,
+    )
+    stats_cache.set(
+        ("accounts_by_regions", resource, gender, regions, period),
+        by_region,
+        ttl=ttl_for_period(period),
+    )
+    return total
+
+
+_MSG_LOADING_SUFFIX = "\n<i>Загрузка статистики...</i>"
+
+# Значение StatRegionCallback.region для "Все регионы" и его отображение в шапке
+_ALL_REGIONS = "all"
+_ALL_REGIONS_DISPLAY = "все регионы"
+_ALL_REGIONS_RESULT_DISPLAY = "🌍 все регионы"  # В сообщении с результатами
+
+
+def _region_label(region: str) -> str:
+    """Регион для сообщения с результатами ("all" — все регионы)"""
+    return _ALL_REGIONS_RESULT_DISPLAY if region == _ALL_REGIONS else region
+
+# Названия периодов из StatPeriodCallback.period
+_PERIOD_NAMES = MappingProxyType({
+    "day": "за день",
+    "week": "за неделю",
+    "month": "за месяц",
+})
+
+
+# Подсказки, дописываемые к шапке
+_PROMPT_TYPE = "\nВыберите тип:"
+_PROMPT_REGION = "\nВыберите регион:"
+_PROMPT_SEARCH_REGION = "\nВведите номер региона (например: 77, 50, 197):"
+_PROMPT_PERIOD = "\nВыберите период:"
+
+
+@lru_cache(maxsize=1024)
+def _build_header(
+    resource: Optional[Resource] = None,
+    gender: Optional[Gender] = None,
+    email_resource: Optional[EmailResource] = None,
+    region_display: Optional[str] = None,
+) -> str:
+    """
+    Шапка сообщений статистики: ресурс, тип и регион (в отображаемом виде).
+
+    Без ресурса строится шапка статистики номеров. Готовые шапки кэшируются
+    (аргументы — enum и строки региона); на шаге выбора региона шапка
+    сохраняется в FSM (stat_header).
+    """
+    if resource is not None:
+        text = f"Ресурс: <b>{resource.display_name}</b>\n"
+    elif email_resource is not None:
+        text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
+    else:
+        # Статистика номеров: без региона шапка — только заголовок
+        text = "📈 <b>Статистика номеров</b>\n\n" if region_display is not None else "📈 <b>Статистика номеров</b>\n"
+
+    # Для VK/OK и Rambler тип не показываем
+    if gender is not None and gender is not Gender.NONE:
+        text += f"Тип: <b>{gender.display_name}</b>\n"
+
+    if region_display is not None:
+        text += f"Регион: <b>{region_display}</b>\n"
+
+    return text
+
+
+def _unpack(data: Dict[str, Any], *keys: str) -> Tuple[Any, ...]:
+    """Значения нескольких ключей FSM одним кортежем (None для отсутствующих)"""
+    return tuple(data.get(key) for key in keys)
+
 
 def is_valid_region(region: str) -> bool:
-    """Проверка существования региона в системе"""
-    return region_service.region_exists(region)
+    """
+    Проверка существования региона в системе (регион уже без пробелов).
+
+    Сначала дешёвая проверка формата — номер из ASCII-цифр (isascii отсекает
+    «полноширинные» и прочие юникодные цифры), затем поиск в снимке регионов.
+    Диапазон номеров не ограничиваем: /add_region принимает любой номер.
+    """
+    return region.isascii() and region.isdigit() and region in _get_regions_frozenset()
+
+
+@lru_cache(maxsize=1)
+def _regions_preview(version: int) -> str:
+    """Первые регионы для подсказки при неверном вводе (кэш по версии списка)"""
+    return ", ".join(_get_regions_tuple()[:5])
 
 
 def format_statistics(
@@ -57,44 +249,35 @@ def format_statistics(
     stats,
 ) -> str:
     """Форматирование статистики для вывода"""
-    period_names = {
-        "day": "за день",
-        "week": "за неделю",
-        "month": "за месяц",
-    }
-    region_display = "🌍 все регионы" if region == "all" else region
-
-    lines = [
-        f"<b>📈 Статистика</b>",
-        f"",
-        f"Ресурс: {resource.display_name}",
-    ]
+    region_display = _region_label(region)
 
     # Для ресурсов с типом добавляем строку типа
-    if gender != Gender.NONE:
-        lines.append(f"Тип: {gender.display_name}")
-
-    lines.extend([
-        f"Регион: {region_display}",
-        f"Период: {period_names.get(period, period)}",
-        f"",
-        f"<b>Результаты:</b>",
-        f"📦 Всего: {stats.total}",
-        f"✅ Хороших: {stats.good}",
-        f"🚫 Блоков: {stats.block}",
-        f"⚠️ Дефектных: {stats.defect}",
-    ])
-
-    if stats.no_status > 0:
-        lines.append(f"❓ Без статуса: {stats.no_status}")
+    gender_line = f"Тип: {gender.display_name}\n" if gender is not Gender.NONE else ""
+    no_status_line = f"\n❓ Без статуса: {stats.no_status}" if stats.no_status > 0 else ""
 
     # Добавляем процент успешных если есть данные
     if stats.total > 0:
         success_rate = (stats.good / stats.total) * 100
-        lines.append(f"")
-        lines.append(f"📊 Процент хороших: <b>{success_rate:.1f}%</b>")
+        success_line = f"\n\n📊 Процент хороших: <b>{success_rate:.1f}%</b>"
+    else:
+        success_line = ""
 
-    return "\n".join(lines)
+    return (
+        f"<b>📈 Статистика</b>\n"
+        f"\n"
+        f"Ресурс: {resource.display_name}\n"
+        f"{gender_line}"
+        f"Регион: {region_display}\n"
+        f"Период: {_PERIOD_NAMES.get(period, period)}\n"
+        f"\n"
+        f"<b>Результаты:</b>\n"
+        f"📦 Всего: {stats.total}\n"
+        f"✅ Хороших: {stats.good}\n"
+        f"🚫 Блоков: {stats.block}\n"
+        f"⚠️ Дефектных: {stats.defect}"
+        f"{no_status_line}"
+        f"{success_line}"
+    )
 
 
 def format_region_stats_line(region: str, stats) -> str:
@@ -120,43 +303,37 @@ def format_email_statistics(
     stats,
 ) -> str:
     """Форматирование статистики почт для вывода"""
-    period_names = {
-        "day": "за день",
-        "week": "за неделю",
-        "month": "за месяц",
-    }
-    region_display = "🌍 все регионы" if region == "all" else region
-
-    lines = [
-        f"<b>📈 Статистика почт</b>",
-        f"",
-        f"Ресурс: {email_resource.emoji} {email_resource.display_name}",
-    ]
+    region_display = _region_label(region)
 
     # Для Gmail добавляем тип
-    if email_type and email_type != Gender.NONE:
-        lines.append(f"Тип: {email_type.display_name}")
-
-    lines.extend([
-        f"Регион: {region_display}",
-        f"Период: {period_names.get(period, period)}",
-        f"",
-        f"<b>Результаты:</b>",
-        f"📦 Всего: {stats.total}",
-        f"✅ Хороших: {stats.good}",
-        f"🚫 Блоков: {stats.block}",
-        f"⚠️ Дефектных: {stats.defect}",
-    ])
-
-    if stats.no_status > 0:
-        lines.append(f"❓ Без статуса: {stats.no_status}")
+    type_line = (
+        f"Тип: {email_type.display_name}\n"
+        if email_type is not None and email_type is not Gender.NONE else ""
+    )
+    no_status_line = f"\n❓ Без статуса: {stats.no_status}" if stats.no_status > 0 else ""
 
     if stats.total > 0:
         success_rate = (stats.good / stats.total) * 100
-        lines.append(f"")
-        lines.append(f"📊 Процент хороших: <b>{success_rate:.1f}%</b>")
+        success_line = f"\n\n📊 Процент хороших: <b>{success_rate:.1f}%</b>"
+    else:
+        success_line = ""
 
-    return "\n".join(lines)
+    return (
+        f"<b>📈 Статистика почт</b>\n"
+        f"\n"
+        f"Ресурс: {email_resource.emoji} {email_resource.display_name}\n"
+        f"{type_line}"
+        f"Регион: {region_display}\n"
+        f"Период: {_PERIOD_NAMES.get(period, period)}\n"
+        f"\n"
+        f"<b>Результаты:</b>\n"
+        f"📦 Всего: {stats.total}\n"
+        f"✅ Хороших: {stats.good}\n"
+        f"🚫 Блоков: {stats.block}\n"
+        f"⚠️ Дефектных: {stats.defect}"
+        f"{no_status_line}"
+        f"{success_line}"
+    )
 
 
 def format_number_statistics(
@@ -165,42 +342,37 @@ def format_number_statistics(
     stats: NumberStatistics,
 ) -> str:
     """Форматирование статистики номеров для вывода"""
-    period_names = {
-        "day": "за день",
-        "week": "за неделю",
-        "month": "за месяц",
-    }
-    region_display = "🌍 все регионы" if region == "all" else region
-
-    lines = [
-        f"<b>📈 Статистика номеров</b>",
-        f"",
-        f"Регион: {region_display}",
-        f"Период: {period_names.get(period, period)}",
-        f"",
-        f"<b>Номеров выдано:</b> {stats.total}",
-        f"",
-        f"<b>Регистрации по ресурсам:</b>",
-        f"🟧 Beboo: {stats.beboo}",
-        f"🟦 Loloo: {stats.loloo}",
-        f"🟥 Табор: {stats.tabor}",
-        f"",
-        f"<b>Статусы:</b>",
-        f"✅ Рабочих: {stats.working}",
-        f"🔄 Сброс: {stats.reset}",
-        f"📝 Зарегистрирован: {stats.registered}",
-        f"❌ Выбило ТГ: {stats.tg_kicked}",
-    ]
-
-    if stats.no_status > 0:
-        lines.append(f"❓ Без статуса: {stats.no_status}")
+    region_display = _region_label(region)
+
+    no_status_line = f"\n❓ Без статуса: {stats.no_status}" if stats.no_status > 0 else ""
 
     if stats.total > 0:
         working_rate = (stats.working / stats.total) * 100
-        lines.append(f"")
-        lines.append(f"📊 Процент рабочих: <b>{working_rate:.1f}%</b>")
+        working_line = f"\n\n📊 Процент рабочих: <b>{working_rate:.1f}%</b>"
+    else:
+        working_line = ""
 
-    return "\n".join(lines)
+    return (
+        f"<b>📈 Статистика номеров</b>\n"
+        f"\n"
+        f"Регион: {region_display}\n"
+        f"Период: {_PERIOD_NAMES.get(period, period)}\n"
+        f"\n"
+        f"<b>Номеров выдано:</b> {stats.total}\n"
+        f"\n"
+        f"<b>Регистрации по ресурсам:</b>\n"
+        f"🟧 Beboo: {stats.beboo}\n"
+        f"🟦 Loloo: {stats.loloo}\n"
+        f"🟥 Табор: {stats.tabor}\n"
+        f"\n"
+        f"<b>Статусы:</b>\n"
+        f"✅ Рабочих: {stats.working}\n"
+        f"🔄 Сброс: {stats.reset}\n"
+        f"📝 Зарегистрирован: {stats.registered}\n"
+        f"❌ Выбило ТГ: {stats.tg_kicked}"
+        f"{no_status_line}"
+        f"{working_line}"
+    )
 
 
 def format_number_region_stats_line(region: str, stats: NumberStatistics) -> str:
@@ -217,18 +389,53 @@ def format_number_region_stats_line(region: str, stats: NumberStatistics) -> str
     )
 
 
+_MSG_RESOURCE_MENU = "📈 <b>Статистика</b>\n\nВыберите ресурс:"
+_MSG_EMAIL_RESOURCE_MENU = "📈 <b>Статистика почт</b>\n\nВыберите ресурс:"
+
+
+async def _show_resource_menu(
+    message: Message,
+    state: FSMContext,
+    resource_state: State,
+    text: str,
+    keyboard: InlineKeyboardMarkup,
+) -> None:
+    """Перейти к выбору ресурса (общий шаг для меню и кнопок "Назад")"""
+    await state.set_state(resource_state)
+    await message.edit_text(text, reply_markup=keyboard, parse_mode="HTML")
+
+
+_MSG_NEXT_RESOURCE = "\n\nВыберите ресурс для новой статистики:"
+
+
+async def _show_result(
+    message: Message,
+    state: FSMContext,
+    text: str,
+    keyboard: InlineKeyboardMarkup,
+) -> None:
+    """
+    Показать результат статистики вместе с выбором ресурса для новой.
+
+    Одним edit_text вместо результата + отдельного меню: FSM сразу
+    возвращается к выбору ресурса.
+    """
+    await state.set_state(StatisticStates.selecting_resource)
+    await state.set_data({})
+    await message.edit_text(text + _MSG_NEXT_RESOURCE, reply_markup=keyboard, parse_mode="HTML")
+
+
 # ================== КОМАНДА /statistic ==================
 
 @router.message(Command("statistic"))
 async def cmd_statistic(message: Message, state: FSMContext):
     """Обработка команды /statistic"""
-    await state.clear()
     await state.set_state(StatisticStates.selecting_resource)
+    await state.set_data({})
 
     await message.answer(
-        "📈 <b>Статистика</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_resource_keyboard(),
+        _MSG_RESOURCE_MENU,
+        reply_markup=_RESOURCE_KB,
         parse_mode="HTML",
     )
 
@@ -243,27 +450,25 @@ async def stat_process_resource(
 ):
     """Обработка выбора ресурса"""
     await callback.answer()
-    resource = Resource(callback_data.resource)
-
-    await state.update_data(stat_resource=resource)
+    resource = _RES_BY_VALUE[callback_data.resource]
 
     # Для VK и OK пропускаем выбор пола
     if resource in (Resource.VK, Resource.OK):
-        await state.update_data(stat_gender=Gender.NONE)
+        # Ресурс и пустой тип — одной записью в FSM
+        await state.update_data(stat_resource=resource, stat_gender=Gender.NONE)
         await state.set_state(StatisticStates.selecting_region)
 
         await callback.message.edit_text(
-            f"Ресурс: <b>{resource.display_name}</b>\n\n"
-            f"Выберите регион:",
+            _build_header(resource=resource) + _PROMPT_REGION,
             reply_markup=get_stat_region_keyboard(),
             parse_mode="HTML",
         )
     else:
+        await state.update_data(stat_resource=resource)
         await state.set_state(StatisticStates.selecting_gender)
 
         await callback.message.edit_text(
-            f"Ресурс: <b>{resource.display_name}</b>\n\n"
-            f"Выберите тип:",
+            _build_header(resource=resource) + _PROMPT_TYPE,
             reply_markup=get_stat_gender_keyboard(resource),
             parse_mode="HTML",
         )
@@ -277,116 +482,20 @@ async def stat_process_gender(
 ):
     """Обработка выбора пола/типа (для аккаунтов)"""
     await callback.answer()
-    gender = Gender(callback_data.gender)
-    data = await state.get_data()
+    gender = _GENDER_BY_VALUE[callback_data.gender]
+    # update_data возвращает обновлённые данные — отдельный get_data не нужен
+    data = await state.update_data(stat_gender=gender)
     resource = data["stat_resource"]
 
-    await state.update_data(stat_gender=gender)
     await state.set_state(StatisticStates.selecting_region)
 
     await callback.message.edit_text(
-        f"Ресурс: <b>{resource.display_name}</b>\n"
-        f"Тип: <b>{gender.display_name}</b>\n\n"
-        f"Выберите регион:",
+        _build_header(resource=resource, gender=gender) + _PROMPT_REGION,
         reply_markup=get_stat_region_keyboard(),
         parse_mode="HTML",
     )
 
 
-@router.callback_query(StatRegionCallback.filter(), StatisticStates.selecting_region)
-async def stat_process_region(
-    callback: CallbackQuery,
-    callback_data: StatRegionCallback,
-    state: FSMContext,
-):
-    """Обработка выбора региона (для аккаунтов)"""
-    await callback.answer()
-    region = callback_data.region
-    data = await state.get_data()
-    resource = data["stat_resource"]
-    gender = data["stat_gender"]
-
-    region_display = "все регионы" if region == "all" else region
-
-    await state.update_data(stat_region=region)
-    await state.set_state(StatisticStates.selecting_period)
-
-    # Для VK/OK не показываем тип
-    text = f"Ресурс: <b>{resource.display_name}</b>\n"
-    if gender != Gender.NONE:
-        text += f"Тип: <b>{gender.display_name}</b>\n"
-    text += f"Регион: <b>{region_display}</b>\n\nВыберите период:"
-
-    await callback.message.edit_text(
-        text,
-        reply_markup=get_stat_period_keyboard(),
-        parse_mode="HTML",
-    )
-
-
-@router.callback_query(StatSearchRegionCallback.filter(), StatisticStates.selecting_region)
-async def stat_search_region_start(callback: CallbackQuery, state: FSMContext):
-    """Начало поиска региона в статистике (для аккаунтов)"""
-    await callback.answer()
-    data = await state.get_data()
-    resource = data["stat_resource"]
-    gender = data["stat_gender"]
-
-    await state.set_state(StatisticStates.searching_region)
-
-    text = f"Ресурс: <b>{resource.display_name}</b>\n"
-    if gender != Gender.NONE:
-        text += f"Тип: <b>{gender.display_name}</b>\n"
-    text += "\nВведите номер региона (например: 77, 50, 197):"
-
-    await callback.message.edit_text(
-        text,
-        reply_markup=get_stat_back_to_region_keyboard(),
-        parse_mode="HTML",
-    )
-
-
-@router.message(StatisticStates.searching_region)
-async def stat_search_region_input(message: Message, state: FSMContext):
-    """Обработка ввода региона в статистике (для аккаунтов)"""
-    region = message.text.strip()
-    data = await state.get_data()
-    resource = data["stat_resource"]
-    gender = data["stat_gender"]
-
-    if not region:
-        await message.answer(
-            "Введите номер региона:",
-            reply_markup=get_stat_back_to_region_keyboard(),
-        )
-        return
-
-    if not is_valid_region(region):
-        available = ", ".join(region_service.get_regions()[:5])
-        await message.answer(
-            f"❌ Такого региона не существует: <b>{region}</b>\n\n"
-            f"Доступные регионы: {available}...\n"
-            f"Введите существующий регион или выберите из списка:",
-            reply_markup=get_stat_back_to_region_keyboard(),
-            parse_mode="HTML",
-        )
-        return
-
-    await state.update_data(stat_region=region)
-    await state.set_state(StatisticStates.selecting_period)
-
-    text = f"Ресурс: <b>{resource.display_name}</b>\n"
-    if gender != Gender.NONE:
-        text += f"Тип: <b>{gender.display_name}</b>\n"
-    text += f"Регион: <b>{region}</b>\n\nВыберите период:"
-
-    await message.answer(
-        text,
-        reply_markup=get_stat_period_keyboard(),
-        parse_mode="HTML",
-    )
-
-
 @router.callback_query(StatPeriodCallback.filter(), StatisticStates.selecting_period)
 async def stat_process_period(
     callback: CallbackQuery,
@@ -397,66 +506,73 @@ async def stat_process_period(
     await callback.answer()
 
     period = callback_data.period
-    data = await state.get_data()
-    resource = data["stat_resource"]
-    gender = data["stat_gender"]
-    region = data["stat_region"]
+    resource, gender, region, header = _unpack(
+        await state.get_data(), "stat_resource", "stat_gender", "stat_region", "stat_header"
+    )
 
-    # Показываем загрузку
-    region_display = "все регионы" if region == "all" else region
-    text = f"Ресурс: <b>{resource.display_name}</b>\n"
-    if gender != Gender.NONE:
-        text += f"Тип: <b>{gender.display_name}</b>\n"
-    text += f"Регион: <b>{region_display}</b>\n\n<i>Загрузка статистики...</i>"
+    if region == _ALL_REGIONS:
+        # Сводка по всем регионам зависит от списка регионов — он входит в ключ
+        # (как у детальной статистики), после /add_region кэш не устаревает
+        regions = _get_regions_tuple()
+        cache_key = ("accounts", resource, gender, region, regions, period)
+    else:
+        cache_key = ("accounts", resource, gender, region, period)
 
-    await callback.message.edit_text(text, parse_mode="HTML")
+    # Показываем загрузку (только если результата нет в кэше)
+    if _need_loading_placeholder(cache_key):
+        await callback.message.edit_text(
+            header + _MSG_LOADING_SUFFIX,
+            parse_mode="HTML",
+        )
 
     try:
         # Получаем статистику
-        stats = await sheets_service.get_statistics(
-            resource=resource,
-            gender=gender,
-            region=region if region != "all" else None,
-            period=period,
-        )
+        if region == _ALL_REGIONS:
+            # Сводка и детальная статистика по регионам — одним чтением листа
+            stats = await _cached_fetch(
+                cache_key,
+                _fetch_all_regions_overview,
+                resource=resource,
+                gender=gender,
+                regions=regions,
+                period=period,
+            )
+        else:
+            stats = await _cached_fetch(
+                cache_key,
+                _get_statistics,
+                resource=resource,
+                gender=gender,
+                region=region,
+                period=period,
+            )
 
         # Форматируем и показываем
         stats_text = format_statistics(resource, gender, region, period, stats)
 
         # Если выбраны все регионы — показываем кнопку "Детальнее"
-        if region == "all":
-            await callback.message.edit_text(
+        if region == _ALL_REGIONS:
+            await _show_result(
+                callback.message,
+                state,
                 stats_text,
-                reply_markup=get_stat_detailed_keyboard(
+                get_stat_detailed_keyboard(
                     resource=resource.value,
                     gender=gender.value,
                     period=period,
                 ),
-                parse_mode="HTML",
             )
         else:
-            await callback.message.edit_text(
-                stats_text,
-                parse_mode="HTML",
-            )
+            await _show_result(callback.message, state, stats_text, _RESOURCE_KB)
 
     except Exception as e:
-        logger.error(f"Error getting statistics: {e}")
+        logger.error("Error getting statistics: %s", e, exc_info=True)
         await callback.message.edit_text(
             "Произошла ошибка при получении статистики.\n"
-            "Попробуйте позже."
+            "Попробуйте позже.",
+            reply_markup=_BACK_TO_MENU_KB,
         )
 
-    # Возвращаемся к выбору ресурса статистики
-    await state.clear()
-    await state.set_state(StatisticStates.selecting_resource)
-    await callback.message.answer(
-        "📈 <b>Статистика</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_resource_keyboard(),
-        parse_mode="HTML",
-    )
-
 
 @router.callback_query(StatDetailedByRegionsCallback.filter())
 async def stat_detailed_by_regions(
@@ -466,75 +582,70 @@ async def stat_detailed_by_regions(
     """Показ детальной статистики по каждому региону (для аккаунтов)"""
     await callback.answer()
 
-    resource = Resource(callback_data.resource)
-    gender = Gender(callback_data.gender)
+    resource = _RES_BY_VALUE[callback_data.resource]
+    gender = _GENDER_BY_VALUE[callback_data.gender]
     period = callback_data.period
 
-    period_names = {
-        "day": "за день",
-        "week": "за неделю",
-        "month": "за месяц",
-    }
+    # Получаем список всех регионов (общий кортеж сервиса, без копирования)
+    regions = _get_regions_tuple()
+    cache_key = ("accounts_by_regions", resource, gender, regions, period)
 
-    # Показываем загрузку
-    await callback.message.edit_text(
-        f"<b>📊 Детальная статистика по регионам</b>\n\n"
-        f"Ресурс: {resource.display_name}\n"
-        f"Тип: {gender.display_name}\n"
-        f"Период: {period_names.get(period, period)}\n\n"
-        f"<i>Загрузка...</i>",
-        parse_mode="HTML",
-    )
+    # Показываем загрузку (только если результата нет в кэше)
+    if _need_loading_placeholder(cache_key):
+        await callback.message.edit_text(
+            f"<b>📊 Детальная статистика по регионам</b>\n\n"
+            f"Ресурс: {resource.display_name}\n"
+            f"Тип: {gender.display_name}\n"
+            f"Период: {_PERIOD_NAMES.get(period, period)}\n\n"
+            f"<i>Загрузка...</i>",
+            parse_mode="HTML",
+        )
 
     try:
-        # Получаем список всех регионов
-        regions = region_service.get_regions()
-
         # Получаем статистику по всем регионам
-        stats_by_region = await sheets_service.get_statistics_by_regions(
+        stats_by_region = await _cached_fetch(
+            cache_key,
+            _get_statistics_by_regions,
             resource=resource,
             gender=gender,
             regions=regions,
             period=period,
         )
 
-        # Формируем текст
-        lines = [
-            f"<b>📊 Детальная статистика по регионам</b>",
-            f"",
-            f"Ресурс: {resource.display_name}",
-        ]
-
+        # Формируем текст: шапка и строки регионов (отсортированы)
         # Для ресурсов с типом добавляем строку типа
-        if gender != Gender.NONE:
-            lines.append(f"Тип: {gender.display_name}")
-
-        lines.extend([
-            f"Период: {period_names.get(period, period)}",
-            f"",
-        ])
-
-        # Добавляем статистику по каждому региону (отсортированы)
-        for region in regions:
-            stats = stats_by_region.get(region)
-            if stats:
-                lines.append(format_region_stats_line(region, stats))
+        gender_line = f"Тип: {gender.display_name}\n" if gender is not Gender.NONE else ""
+        header = (
+            f"<b>📊 Детальная статистика по регионам</b>\n"
+            f"\n"
+            f"Ресурс: {resource.display_name}\n"
+            f"{gender_line}"
+            f"Период: {_PERIOD_NAMES.get(period, period)}\n"
+        )
+        # Если все регионы пустые — строки регионов не форматируем вовсе
+        if any(s.total for s in stats_by_region.values()):
+            body = (
+                format_region_stats_line(region, stats)
+                for region in regions
+                if (stats := stats_by_region.get(region))
+            )
+        else:
+            body = ("Нет данных за выбранный период",)
 
-        # Если все регионы пустые
-        total_all = sum(s.total for s in stats_by_region.values())
-        if total_all == 0:
-            lines.append("Нет данных за выбранный период")
+        text = "\n".join(chain((header,), body))
 
         await callback.message.edit_text(
-            "\n".join(lines),
+            text,
+            reply_markup=_BACK_TO_MENU_KB,
             parse_mode="HTML",
         )
 
     except Exception as e:
-        logger.error(f"Error getting detailed statistics: {e}")
+        logger.error("Error getting detailed statistics: %s", e, exc_info=True)
         await callback.message.edit_text(
             "Произошла ошибка при получении статистики.\n"
-            "Попробуйте позже."
+            "Попробуйте позже.",
+            reply_markup=_BACK_TO_MENU_KB,
         )
 
 
@@ -544,13 +655,9 @@ async def stat_detailed_by_regions(
 async def stat_open_email_menu(callback: CallbackQuery, state: FSMContext):
     """Открытие раздела статистики почт"""
     await callback.answer()
-    await state.set_state(StatisticStates.email_selecting_resource)
-
-    await callback.message.edit_text(
-        "📈 <b>Статистика почт</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_email_resource_keyboard(),
-        parse_mode="HTML",
+    await _show_resource_menu(
+        callback.message, state, StatisticStates.email_selecting_resource,
+        _MSG_EMAIL_RESOURCE_MENU, _EMAIL_RESOURCE_KB,
     )
 
 
@@ -562,26 +669,23 @@ async def stat_email_process_resource(
 ):
     """Обработка выбора почтового ресурса"""
     await callback.answer()
-    email_resource = EmailResource(callback_data.resource)
-
-    await state.update_data(stat_email_resource=email_resource)
+    email_resource = _EMAIL_BY_VALUE[callback_data.resource]
 
     # Для Gmail показываем выбор типа
     if email_resource == EmailResource.GMAIL:
+        await state.update_data(stat_email_resource=email_resource)
         await state.set_state(StatisticStates.email_selecting_type)
         await callback.message.edit_text(
-            f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n\n"
-            f"Выберите тип:",
-            reply_markup=get_stat_email_type_keyboard(),
+            _build_header(email_resource=email_resource) + _PROMPT_TYPE,
+            reply_markup=_EMAIL_TYPE_KB,
             parse_mode="HTML",
         )
     else:
-        # Для Rambler сразу к выбору региона
-        await state.update_data(stat_email_type=None)
+        # Для Rambler сразу к выбору региона (ресурс и тип — одной записью)
+        await state.update_data(stat_email_resource=email_resource, stat_email_type=None)
         await state.set_state(StatisticStates.email_selecting_region)
         await callback.message.edit_text(
-            f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n\n"
-            f"Выберите регион:",
+            _build_header(email_resource=email_resource) + _PROMPT_REGION,
             reply_markup=get_stat_email_region_keyboard(),
             parse_mode="HTML",
         )
@@ -595,324 +699,309 @@ async def stat_email_process_type(
 ):
     """Обработка выбора типа Gmail"""
     await callback.answer()
-    email_type = Gender(callback_data.gender)
-    data = await state.get_data()
+    email_type = _GENDER_BY_VALUE[callback_data.gender]
+    data = await state.update_data(stat_email_type=email_type)
     email_resource = data["stat_email_resource"]
 
-    await state.update_data(stat_email_type=email_type)
     await state.set_state(StatisticStates.email_selecting_region)
 
     await callback.message.edit_text(
-        f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-        f"Тип: <b>{email_type.display_name}</b>\n\n"
-        f"Выберите регион:",
+        _build_header(email_resource=email_resource, gender=email_type) + _PROMPT_REGION,
         reply_markup=get_stat_email_region_keyboard(),
         parse_mode="HTML",
     )
 
 
-@router.callback_query(StatRegionCallback.filter(), StatisticStates.email_selecting_region)
-async def stat_email_process_region(
+@router.callback_query(StatPeriodCallback.filter(), StatisticStates.email_selecting_period)
+async def stat_email_process_period(
     callback: CallbackQuery,
-    callback_data: StatRegionCallback,
+    callback_data: StatPeriodCallback,
     state: FSMContext,
 ):
-    """Обработка выбора региона для почт"""
+    """Обработка выбора периода и показ статистики почт"""
     await callback.answer()
-    region = callback_data.region
-    data = await state.get_data()
-    email_resource = data["stat_email_resource"]
-    email_type = data.get("stat_email_type")
 
-    region_display = "все регионы" if region == "all" else region
-
-    await state.update_data(stat_email_region=region)
-    await state.set_state(StatisticStates.email_selecting_period)
-
-    text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-    if email_type:
-        text += f"Тип: <b>{email_type.display_name}</b>\n"
-    text += f"Регион: <b>{region_display}</b>\n\nВыберите период:"
-
-    await callback.message.edit_text(
-        text,
-        reply_markup=get_stat_email_period_keyboard(),
-        parse_mode="HTML",
+    period = callback_data.period
+    email_resource, email_type, region, header = _unpack(
+        await state.get_data(), "stat_email_resource", "stat_email_type", "stat_email_region", "stat_header"
     )
 
+    cache_key = ("emails", email_resource, email_type, region, period)
 
-@router.callback_query(StatSearchRegionCallback.filter(), StatisticStates.email_selecting_region)
-async def stat_email_search_region_start(callback: CallbackQuery, state: FSMContext):
-    """Начало поиска региона в статистике почт"""
-    await callback.answer()
-    data = await state.get_data()
-    email_resource = data["stat_email_resource"]
-    email_type = data.get("stat_email_type")
-
-    await state.set_state(StatisticStates.email_searching_region)
-
-    text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-    if email_type:
-        text += f"Тип: <b>{email_type.display_name}</b>\n"
-    text += f"\nВведите номер региона (например: 77, 50, 197):"
-
-    await callback.message.edit_text(
-        text,
-        reply_markup=get_stat_email_back_to_region_keyboard(),
-        parse_mode="HTML",
-    )
+    # Показываем загрузку (только если результата нет в кэше)
+    if _need_loading_placeholder(cache_key):
+        await callback.message.edit_text(
+            header + _MSG_LOADING_SUFFIX,
+            parse_mode="HTML",
+        )
 
+    try:
+        stats = await _cached_fetch(
+            cache_key,
+            _get_email_statistics,
+            email_resource=email_resource,
+            email_type=email_type,
+            region=region if region != _ALL_REGIONS else None,
+            period=period,
+        )
 
-@router.message(StatisticStates.email_searching_region)
-async def stat_email_search_region_input(message: Message, state: FSMContext):
-    """Обработка ввода региона в статистике почт"""
-    region = message.text.strip()
-    data = await state.get_data()
-    email_resource = data["stat_email_resource"]
-    email_type = data.get("stat_email_type")
+        stats_text = format_email_statistics(email_resource, email_type, region, period, stats)
+        await _show_result(callback.message, state, stats_text, _RESOURCE_KB)
 
-    if not region:
-        await message.answer(
-            "Введите номер региона:",
-            reply_markup=get_stat_email_back_to_region_keyboard(),
+    except Exception as e:
+        logger.error("Error getting email statistics: %s", e, exc_info=True)
+        await callback.message.edit_text(
+            "Произошла ошибка при получении статистики.\n"
+            "Попробуйте позже.",
+            reply_markup=_BACK_TO_MENU_KB,
         )
-        return
 
-    if not is_valid_region(region):
-        available = ", ".join(region_service.get_regions()[:5])
-        await message.answer(
-            f"❌ Такого региона не существует: <b>{region}</b>\n\n"
-            f"Доступные регионы: {available}...\n"
-            f"Введите существующий регион или выберите из списка:",
-            reply_markup=get_stat_email_back_to_region_keyboard(),
-            parse_mode="HTML",
-        )
-        return
 
-    await state.update_data(stat_email_region=region)
-    await state.set_state(StatisticStates.email_selecting_period)
+# ================== НОМЕРА ==================
 
-    text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-    if email_type:
-        text += f"Тип: <b>{email_type.display_name}</b>\n"
-    text += f"Регион: <b>{region}</b>\n\nВыберите период:"
+@router.callback_query(StatNumberMenuCallback.filter(), StatisticStates.selecting_resource)
+async def stat_open_number_menu(callback: CallbackQuery, state: FSMContext):
+    """Открытие раздела статистики номеров"""
+    await callback.answer()
+    await state.set_state(StatisticStates.number_selecting_region)
 
-    await message.answer(
-        text,
-        reply_markup=get_stat_email_period_keyboard(),
+    await callback.message.edit_text(
+        _build_header() + _PROMPT_REGION,
+        reply_markup=get_stat_number_region_keyboard(),
         parse_mode="HTML",
     )
 
 
-@router.callback_query(StatPeriodCallback.filter(), StatisticStates.email_selecting_period)
-async def stat_email_process_period(
+@router.callback_query(StatPeriodCallback.filter(), StatisticStates.number_selecting_period)
+async def stat_number_process_period(
     callback: CallbackQuery,
     callback_data: StatPeriodCallback,
     state: FSMContext,
 ):
-    """Обработка выбора периода и показ статистики почт"""
+    """Обработка выбора периода и показ статистики номеров"""
     await callback.answer()
 
     period = callback_data.period
-    data = await state.get_data()
-    email_resource = data["stat_email_resource"]
-    email_type = data.get("stat_email_type")
-    region = data["stat_email_region"]
+    region, header = _unpack(await state.get_data(), "stat_number_region", "stat_header")
 
-    region_display = "все регионы" if region == "all" else region
+    cache_key = ("numbers", region, period)
 
-    # Показываем загрузку
-    text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-    if email_type:
-        text += f"Тип: <b>{email_type.display_name}</b>\n"
-    text += f"Регион: <b>{region_display}</b>\n\n<i>Загрузка статистики...</i>"
-
-    await callback.message.edit_text(text, parse_mode="HTML")
+    # Показываем загрузку (только если результата нет в кэше)
+    if _need_loading_placeholder(cache_key):
+        await callback.message.edit_text(
+            header + _MSG_LOADING_SUFFIX,
+            parse_mode="HTML",
+        )
 
     try:
-        stats = await sheets_service.get_email_statistics(
-            email_resource=email_resource,
-            email_type=email_type,
-            region=region if region != "all" else None,
+        stats = await _cached_fetch(
+            cache_key,
+            _get_number_statistics,
+            region=region if region != _ALL_REGIONS else None,
             period=period,
         )
 
-        stats_text = format_email_statistics(email_resource, email_type, region, period, stats)
-        await callback.message.edit_text(stats_text, parse_mode="HTML")
+        stats_text = format_number_statistics(region, period, stats)
+        await _show_result(callback.message, state, stats_text, _RESOURCE_KB)
 
     except Exception as e:
-        logger.error(f"Error getting email statistics: {e}")
+        logger.error("Error getting number statistics: %s", e, exc_info=True)
         await callback.message.edit_text(
             "Произошла ошибка при получении статистики.\n"
-            "Попробуйте позже."
+            "Попробуйте позже.",
+            reply_markup=_BACK_TO_MENU_KB,
         )
 
-    # Возвращаемся к главному меню статистики
-    await state.clear()
-    await state.set_state(StatisticStates.selecting_resource)
-    await callback.message.answer(
-        "📈 <b>Статистика</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_resource_keyboard(),
-        parse_mode="HTML",
-    )
 
+# ================== ВЫБОР РЕГИОНА (общий для всех разделов) ==================
 
-# ================== НОМЕРА ==================
+@dataclass(frozen=True)
+class _StatFlow:
+    """Раздел статистики (аккаунты / почты / номера) для общих шагов выбора региона"""
+    searching_state: State
+    period_state: State
+    region_key: str  # Ключ FSM для выбранного региона
+    period_keyboard: InlineKeyboardMarkup
+    back_to_region_keyboard: InlineKeyboardMarkup
+    header_kwargs: Callable[[Dict[str, Any]], Dict[str, Any]]  # Аргументы _build_header из FSM
 
-@router.callback_query(StatNumberMenuCallback.filter(), StatisticStates.selecting_resource)
-async def stat_open_number_menu(callback: CallbackQuery, state: FSMContext):
-    """Открытие раздела статистики номеров"""
+
+def _account_header_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"resource": data["stat_resource"], "gender": data["stat_gender"]}
+
+
+def _email_header_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"email_resource": data["stat_email_resource"], "gender": data.get("stat_email_type")}
+
+
+def _number_header_kwargs(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {}
+
+
+_ACCOUNT_FLOW = _StatFlow(
+    searching_state=StatisticStates.searching_region,
+    period_state=StatisticStates.selecting_period,
+    region_key="stat_region",
+    period_keyboard=get_stat_period_keyboard(),
+    back_to_region_keyboard=get_stat_back_to_region_keyboard(),
+    header_kwargs=_account_header_kwargs,
+)
+_EMAIL_FLOW = _StatFlow(
+    searching_state=StatisticStates.email_searching_region,
+    period_state=StatisticStates.email_selecting_period,
+    region_key="stat_email_region",
+    period_keyboard=get_stat_email_period_keyboard(),
+    back_to_region_keyboard=get_stat_email_back_to_region_keyboard(),
+    header_kwargs=_email_header_kwargs,
+)
+_NUMBER_FLOW = _StatFlow(
+    searching_state=StatisticStates.number_searching_region,
+    period_state=StatisticStates.number_selecting_period,
+    region_key="stat_number_region",
+    period_keyboard=get_stat_number_period_keyboard(),
+    back_to_region_keyboard=get_stat_number_back_to_region_keyboard(),
+    header_kwargs=_number_header_kwargs,
+)
+
+# Состояние FSM -> раздел (для выбора региона и для ручного ввода)
+_FLOWS: Dict[str, _StatFlow] = {
+    StatisticStates.selecting_region.state: _ACCOUNT_FLOW,
+    StatisticStates.searching_region.state: _ACCOUNT_FLOW,
+    StatisticStates.email_selecting_region.state: _EMAIL_FLOW,
+    StatisticStates.email_searching_region.state: _EMAIL_FLOW,
+    StatisticStates.number_selecting_region.state: _NUMBER_FLOW,
+    StatisticStates.number_searching_region.state: _NUMBER_FLOW,
+}
+
+_REGION_STATES = StateFilter(
+    StatisticStates.selecting_region,
+    StatisticStates.email_selecting_region,
+    StatisticStates.number_selecting_region,
+)
+_SEARCHING_STATES = StateFilter(
+    StatisticStates.searching_region,
+    StatisticStates.email_searching_region,
+    StatisticStates.number_searching_region,
+)
+
+
+async def _select_region(
+    flow: _StatFlow,
+    data: Dict[str, Any],
+    region: str,
+    region_display: str,
+    state: FSMContext,
+) -> str:
+    """Сохранить регион и перейти к выбору периода. Возвращает текст сообщения."""
+    header = _build_header(region_display=region_display, **flow.header_kwargs(data))
+
+    await state.update_data({flow.region_key: region, "stat_header": header})
+    await state.set_state(flow.period_state)
+
+    return header + _PROMPT_PERIOD
+
+
+@router.callback_query(StatRegionCallback.filter(F.region == _ALL_REGIONS), _REGION_STATES)
+async def stat_process_region_all(callback: CallbackQuery, state: FSMContext, raw_state: str):
+    """Обработка выбора "Все регионы" (аккаунты, почты, номера)"""
     await callback.answer()
-    await state.set_state(StatisticStates.number_selecting_region)
+    flow = _FLOWS[raw_state]
+    data = await state.get_data()
+
+    text = await _select_region(flow, data, _ALL_REGIONS, _ALL_REGIONS_DISPLAY, state)
 
     await callback.message.edit_text(
-        "📈 <b>Статистика номеров</b>\n\n"
-        "Выберите регион:",
-        reply_markup=get_stat_number_region_keyboard(),
+        text,
+        reply_markup=flow.period_keyboard,
         parse_mode="HTML",
     )
 
 
-@router.callback_query(StatRegionCallback.filter(), StatisticStates.number_selecting_region)
-async def stat_number_process_region(
+@router.callback_query(StatRegionCallback.filter(F.region != _ALL_REGIONS), _REGION_STATES)
+async def stat_process_region(
     callback: CallbackQuery,
     callback_data: StatRegionCallback,
     state: FSMContext,
+    raw_state: str,
 ):
-    """Обработка выбора региона для номеров"""
+    """Обработка выбора конкретного региона (аккаунты, почты, номера)"""
     await callback.answer()
+    flow = _FLOWS[raw_state]
+    data = await state.get_data()
     region = callback_data.region
 
-    region_display = "все регионы" if region == "all" else region
-
-    await state.update_data(stat_number_region=region)
-    await state.set_state(StatisticStates.number_selecting_period)
+    text = await _select_region(flow, data, region, region, state)
 
     await callback.message.edit_text(
-        f"📈 <b>Статистика номеров</b>\n\n"
-        f"Регион: <b>{region_display}</b>\n\n"
-        f"Выберите период:",
-        reply_markup=get_stat_number_period_keyboard(),
+        text,
+        reply_markup=flow.period_keyboard,
         parse_mode="HTML",
     )
 
 
-@router.callback_query(StatSearchRegionCallback.filter(), StatisticStates.number_selecting_region)
-async def stat_number_search_region_start(callback: CallbackQuery, state: FSMContext):
-    """Начало поиска региона в статистике номеров"""
+@router.callback_query(StatSearchRegionCallback.filter(), _REGION_STATES)
+async def stat_search_region_start(callback: CallbackQuery, state: FSMContext, raw_state: str):
+    """Начало поиска региона в статистике (аккаунты, почты, номера)"""
     await callback.answer()
-    await state.set_state(StatisticStates.number_searching_region)
+    flow = _FLOWS[raw_state]
+    data = await state.get_data()
+
+    await state.set_state(flow.searching_state)
 
     await callback.message.edit_text(
-        "📈 <b>Статистика номеров</b>\n\n"
-        "Введите номер региона (например: 77, 50, 197):",
-        reply_markup=get_stat_number_back_to_region_keyboard(),
+        _build_header(**flow.header_kwargs(data))
+        + _PROMPT_SEARCH_REGION,
+        reply_markup=flow.back_to_region_keyboard,
         parse_mode="HTML",
     )
 
 
-@router.message(StatisticStates.number_searching_region)
-async def stat_number_search_region_input(message: Message, state: FSMContext):
-    """Обработка ввода региона в статистике номеров"""
-    region = message.text.strip()
+@router.message(_SEARCHING_STATES)
+async def stat_search_region_input(message: Message, state: FSMContext, raw_state: str):
+    """Обработка ввода региона в статистике (аккаунты, почты, номера)"""
+    flow = _FLOWS[raw_state]
+    region = message.text.strip() if message.text else ""
 
     if not region:
         await message.answer(
             "Введите номер региона:",
-            reply_markup=get_stat_number_back_to_region_keyboard(),
+            reply_markup=flow.back_to_region_keyboard,
         )
         return
 
     if not is_valid_region(region):
-        available = ", ".join(region_service.get_regions()[:5])
+        available = _regions_preview(region_service.version)
         await message.answer(
             f"❌ Такого региона не существует: <b>{region}</b>\n\n"
             f"Доступные регионы: {available}...\n"
             f"Введите существующий регион или выберите из списка:",
-            reply_markup=get_stat_number_back_to_region_keyboard(),
+            reply_markup=flow.back_to_region_keyboard,
             parse_mode="HTML",
         )
         return
 
-    await state.update_data(stat_number_region=region)
-    await state.set_state(StatisticStates.number_selecting_period)
-
-    await message.answer(
-        f"📈 <b>Статистика номеров</b>\n\n"
-        f"Регион: <b>{region}</b>\n\n"
-        f"Выберите период:",
-        reply_markup=get_stat_number_period_keyboard(),
-        parse_mode="HTML",
-    )
-
-
-@router.callback_query(StatPeriodCallback.filter(), StatisticStates.number_selecting_period)
-async def stat_number_process_period(
-    callback: CallbackQuery,
-    callback_data: StatPeriodCallback,
-    state: FSMContext,
-):
-    """Обработка выбора периода и показ статистики номеров"""
-    await callback.answer()
-
-    period = callback_data.period
     data = await state.get_data()
-    region = data["stat_number_region"]
-
-    region_display = "все регионы" if region == "all" else region
+    text = await _select_region(flow, data, region, region, state)
 
-    # Показываем загрузку
-    await callback.message.edit_text(
-        f"📈 <b>Статистика номеров</b>\n\n"
-        f"Регион: <b>{region_display}</b>\n\n"
-        f"<i>Загрузка статистики...</i>",
-        parse_mode="HTML",
-    )
-
-    try:
-        stats = await sheets_service.get_number_statistics(
-            region=region if region != "all" else None,
-            period=period,
-        )
-
-        stats_text = format_number_statistics(region, period, stats)
-        await callback.message.edit_text(stats_text, parse_mode="HTML")
-
-    except Exception as e:
-        logger.error(f"Error getting number statistics: {e}")
-        await callback.message.edit_text(
-            "Произошла ошибка при получении статистики.\n"
-            "Попробуйте позже."
-        )
-
-    # Возвращаемся к главному меню статистики
-    await state.clear()
-    await state.set_state(StatisticStates.selecting_resource)
-    await callback.message.answer(
-        "📈 <b>Статистика</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_resource_keyboard(),
+    await message.answer(
+        text,
+        reply_markup=flow.period_keyboard,
         parse_mode="HTML",
     )
 
 
 # ================== КНОПКИ "НАЗАД" ==================
 
-@router.callback_query(StatBackCallback.filter(F.to == "resource"))
 async def stat_back_to_resource(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору ресурса (главное меню статистики)"""
     await callback.answer()
-    await state.clear()
-    await state.set_state(StatisticStates.selecting_resource)
-    await callback.message.edit_text(
-        "📈 <b>Статистика</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_resource_keyboard(),
-        parse_mode="HTML",
+    await state.set_data({})
+    await _show_resource_menu(
+        callback.message, state, StatisticStates.selecting_resource, _MSG_RESOURCE_MENU, _RESOURCE_KB
     )
 
 
+# Отдельный хендлер: "назад к типу" действует только на шаге выбора региона
 @router.callback_query(StatBackCallback.filter(F.to == "gender"), StatisticStates.selecting_region)
 async def stat_back_to_gender(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору пола/типа (для аккаунтов) или к ресурсу (для VK/OK)"""
@@ -922,70 +1011,61 @@ async def stat_back_to_gender(callback: CallbackQuery, state: FSMContext):
 
     # Для VK и OK нет выбора типа — возвращаемся сразу к ресурсу
     if not resource or resource in (Resource.VK, Resource.OK):
-        await state.clear()
-        await state.set_state(StatisticStates.selecting_resource)
-        await callback.message.edit_text(
-            "📈 <b>Статистика</b>\n\n"
-            "Выберите ресурс:",
-            reply_markup=get_stat_resource_keyboard(),
-            parse_mode="HTML",
+        await state.set_data({})
+        await _show_resource_menu(
+            callback.message, state, StatisticStates.selecting_resource, _MSG_RESOURCE_MENU, _RESOURCE_KB
         )
     else:
         await state.set_state(StatisticStates.selecting_gender)
         await callback.message.edit_text(
-            f"Ресурс: <b>{resource.display_name}</b>\n\n"
-            f"Выберите тип:",
+            _build_header(resource=resource) + _PROMPT_TYPE,
             reply_markup=get_stat_gender_keyboard(resource),
             parse_mode="HTML",
         )
 
 
-@router.callback_query(StatBackCallback.filter(F.to == "region"))
 async def stat_back_to_region(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору региона (для аккаунтов)"""
     await callback.answer()
-    data = await state.get_data()
-    resource = data.get("stat_resource")
-    gender = data.get("stat_gender")
+    resource, gender = _unpack(await state.get_data(), "stat_resource", "stat_gender")
 
     if not resource or gender is None:
-        await state.set_state(StatisticStates.selecting_resource)
-        await callback.message.edit_text(
-            "📈 <b>Статистика</b>\n\n"
-            "Выберите ресурс:",
-            reply_markup=get_stat_resource_keyboard(),
-            parse_mode="HTML",
+        await _show_resource_menu(
+            callback.message, state, StatisticStates.selecting_resource, _MSG_RESOURCE_MENU, _RESOURCE_KB
         )
     else:
         await state.set_state(StatisticStates.selecting_region)
-        text = f"Ресурс: <b>{resource.display_name}</b>\n"
-        if gender != Gender.NONE:
-            text += f"Тип: <b>{gender.display_name}</b>\n"
-        text += "\nВыберите регион:"
-
         await callback.message.edit_text(
-            text,
+            _build_header(resource=resource, gender=gender) + _PROMPT_REGION,
             reply_markup=get_stat_region_keyboard(),
             parse_mode="HTML",
         )
 
 
+async def stat_back_to_region_known(callback: CallbackQuery, state: FSMContext):
+    """Возврат к выбору региона из шага периода/поиска (ресурс и тип уже в FSM)"""
+    await callback.answer()
+    resource, gender = _unpack(await state.get_data(), "stat_resource", "stat_gender")
+    await state.set_state(StatisticStates.selecting_region)
+    await callback.message.edit_text(
+        _build_header(resource=resource, gender=gender)
+        + _PROMPT_REGION,
+        reply_markup=get_stat_region_keyboard(),
+        parse_mode="HTML",
+    )
+
+
 # === Кнопки назад для почт ===
 
-@router.callback_query(StatBackCallback.filter(F.to == "email_resource"))
 async def stat_back_to_email_resource(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору почтового ресурса"""
     await callback.answer()
-    await state.set_state(StatisticStates.email_selecting_resource)
-    await callback.message.edit_text(
-        "📈 <b>Статистика почт</b>\n\n"
-        "Выберите ресурс:",
-        reply_markup=get_stat_email_resource_keyboard(),
-        parse_mode="HTML",
+    await _show_resource_menu(
+        callback.message, state, StatisticStates.email_selecting_resource,
+        _MSG_EMAIL_RESOURCE_MENU, _EMAIL_RESOURCE_KB,
     )
 
 
-@router.callback_query(StatBackCallback.filter(F.to == "email_type"))
 async def stat_back_to_email_type(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору типа Gmail или к ресурсу (для Rambler)"""
     await callback.answer()
@@ -993,72 +1073,103 @@ async def stat_back_to_email_type(callback: CallbackQuery, state: FSMContext):
     email_resource = data.get("stat_email_resource")
 
     if not email_resource:
-        await state.set_state(StatisticStates.email_selecting_resource)
-        await callback.message.edit_text(
-            "📈 <b>Статистика почт</b>\n\n"
-            "Выберите ресурс:",
-            reply_markup=get_stat_email_resource_keyboard(),
-            parse_mode="HTML",
+        await _show_resource_menu(
+            callback.message, state, StatisticStates.email_selecting_resource,
+            _MSG_EMAIL_RESOURCE_MENU, _EMAIL_RESOURCE_KB,
         )
     elif email_resource == EmailResource.GMAIL:
         await state.set_state(StatisticStates.email_selecting_type)
         await callback.message.edit_text(
-            f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n\n"
-            f"Выберите тип:",
-            reply_markup=get_stat_email_type_keyboard(),
+            _build_header(email_resource=email_resource) + _PROMPT_TYPE,
+            reply_markup=_EMAIL_TYPE_KB,
             parse_mode="HTML",
         )
     else:
         # Rambler - возвращаемся к выбору ресурса
-        await state.set_state(StatisticStates.email_selecting_resource)
-        await callback.message.edit_text(
-            "📈 <b>Статистика почт</b>\n\n"
-            "Выберите ресурс:",
-            reply_markup=get_stat_email_resource_keyboard(),
-            parse_mode="HTML",
+        await _show_resource_menu(
+            callback.message, state, StatisticStates.email_selecting_resource,
+            _MSG_EMAIL_RESOURCE_MENU, _EMAIL_RESOURCE_KB,
         )
 
 
-@router.callback_query(StatBackCallback.filter(F.to == "email_region"))
 async def stat_back_to_email_region(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору региона для почт"""
     await callback.answer()
-    data = await state.get_data()
-    email_resource = data.get("stat_email_resource")
-    email_type = data.get("stat_email_type")
+    email_resource, email_type = _unpack(await state.get_data(), "stat_email_resource", "stat_email_type")
 
     if not email_resource:
-        await state.set_state(StatisticStates.email_selecting_resource)
-        await callback.message.edit_text(
-            "📈 <b>Статистика почт</b>\n\n"
-            "Выберите ресурс:",
-            reply_markup=get_stat_email_resource_keyboard(),
-            parse_mode="HTML",
+        await _show_resource_menu(
+            callback.message, state, StatisticStates.email_selecting_resource,
+            _MSG_EMAIL_RESOURCE_MENU, _EMAIL_RESOURCE_KB,
         )
     else:
         await state.set_state(StatisticStates.email_selecting_region)
-        text = f"Ресурс: <b>{email_resource.emoji} {email_resource.display_name}</b>\n"
-        if email_type:
-            text += f"Тип: <b>{email_type.display_name}</b>\n"
-        text += "\nВыберите регион:"
-
         await callback.message.edit_text(
-            text,
+            _build_header(email_resource=email_resource, gender=email_type)
+            + _PROMPT_REGION,
             reply_markup=get_stat_email_region_keyboard(),
             parse_mode="HTML",
         )
 
 
+async def stat_back_to_email_region_known(callback: CallbackQuery, state: FSMContext):
+    """Возврат к выбору региона почт из шага периода/поиска (ресурс уже в FSM)"""
+    await callback.answer()
+    email_resource, email_type = _unpack(await state.get_data(), "stat_email_resource", "stat_email_type")
+    await state.set_state(StatisticStates.email_selecting_region)
+    await callback.message.edit_text(
+        _build_header(email_resource=email_resource, gender=email_type)
+        + _PROMPT_REGION,
+        reply_markup=get_stat_email_region_keyboard(),
+        parse_mode="HTML",
+    )
+
+
 # === Кнопки назад для номеров ===
 
-@router.callback_query(StatBackCallback.filter(F.to == "number_region"))
 async def stat_back_to_number_region(callback: CallbackQuery, state: FSMContext):
     """Возврат к выбору региона для номеров"""
     await callback.answer()
     await state.set_state(StatisticStates.number_selecting_region)
     await callback.message.edit_text(
-        "📈 <b>Статистика номеров</b>\n\n"
-        "Выберите регион:",
+        _build_header() + _PROMPT_REGION,
         reply_markup=get_stat_number_region_keyboard(),
         parse_mode="HTML",
     )
+
+
+# Таблица обработчиков "Назад": один callback-хендлер вместо фильтра на каждое значение `to`
+_BACK_HANDLERS = MappingProxyType({
+    "resource": stat_back_to_resource,
+    "region": stat_back_to_region,
+    "email_resource": stat_back_to_email_resource,
+    "email_type": stat_back_to_email_type,
+    "email_region": stat_back_to_email_region,
+    "number_region": stat_back_to_number_region,
+})
+
+# Шаги, где данные раздела гарантированно есть в FSM: обработчики без запасных веток
+_BACK_HANDLERS_BY_STATE = MappingProxyType({
+    ("region", StatisticStates.selecting_period.state): stat_back_to_region_known,
+    ("region", StatisticStates.searching_region.state): stat_back_to_region_known,
+    ("email_region", StatisticStates.email_selecting_period.state): stat_back_to_email_region_known,
+    ("email_region", StatisticStates.email_searching_region.state): stat_back_to_email_region_known,
+})
+
+
+@router.callback_query(StatBackCallback.filter(F.to != "gender"))
+async def stat_back(
+    callback: CallbackQuery,
+    callback_data: StatBackCallback,
+    state: FSMContext,
+    raw_state: Optional[str],
+):
+    """Диспетчер кнопок "Назад" в статистике"""
+    handler = (
+        _BACK_HANDLERS_BY_STATE.get((callback_data.to, raw_state))
+        or _BACK_HANDLERS.get(callback_data.to)
+    )
+    if handler is None:
+        await callback.answer()
+        return
+    await handler(callback, state)
@@ -1,4 +1,25 @@
+from typing import Type
+
 from aiogram.filters.callback_data import CallbackData
+from pydantic import ConfigDict
+
+# Callback-данные статистики только читаются: неизменяемые и хешируемые экземпляры
+# (slots в pydantic-моделях не поддерживаются, поэтому только frozen)
+_FROZEN = ConfigDict(frozen=True)
+
+
+def pack_region(callback_cls: Type[CallbackData], region: str) -> str:
+    """
+    Упаковать callback выбора региона без создания pydantic-модели.
+
+    Для классов с единственным полем region результат совпадает с
+    callback_cls(region=region).pack() — клавиатуры регионов собирают
+    десятки таких кнопок за раз.
+    """
+    separator = callback_cls.__separator__
+    if separator in region:
+        raise ValueError(f"Separator symbol {separator!r} can not be used in region {region!r}")
+    return f"{callback_cls.__prefix__}{separator}{region}"
 
 
 class AdminApprovalCallback(CallbackData, prefix="admin"):
@@ -57,51 +78,60 @@ class ReplaceAccountCallback(CallbackData, prefix="repl"):
 
 class StatResourceCallback(CallbackData, prefix="stat_res"):
     """Callback для выбора ресурса в статистике (VK, Mamba, OK)"""
+    model_config = _FROZEN
     resource: str
 
 
 class StatEmailMenuCallback(CallbackData, prefix="stat_email"):
     """Callback для открытия раздела почт в статистике"""
+    model_config = _FROZEN
     action: str  # open
 
 
 class StatEmailResourceCallback(CallbackData, prefix="stat_em_res"):
     """Callback для выбора почтового ресурса в статистике (Gmail/Rambler)"""
+    model_config = _FROZEN
     resource: str  # gmail, rambler
 
 
 class StatNumberMenuCallback(CallbackData, prefix="stat_num"):
     """Callback для открытия раздела номеров в статистике"""
+    model_config = _FROZEN
     action: str  # open
 
 
 class StatGenderCallback(CallbackData, prefix="stat_gen"):
     """Callback для выбора пола/типа в статистике"""
+    model_config = _FROZEN
     gender: str
 
 
 class StatRegionCallback(CallbackData, prefix="stat_reg"):
     """Callback для выбора региона в статистике"""
+    model_config = _FROZEN
     region: str  # "all" для всех регионов
 
 
 class StatSearchRegionCallback(CallbackData, prefix="stat_search"):
     """Callback для поиска региона в статистике"""
-    pass
+    model_config = _FROZEN
 
 
 class StatPeriodCallback(CallbackData, prefix="stat_per"):
     """Callback для выбора периода в статистике"""
+    model_config = _FROZEN
     period: str  # day, week, month
 
 
 class StatBackCallback(CallbackData, prefix="stat_back"):
     """Callback для кнопки назад в статистике"""
+    model_config = _FROZEN
     to: str  # resource, gender, region, period
 
 
 class StatDetailedByRegionsCallback(CallbackData, prefix="stat_det"):
     """Callback для детальной статистики по регионам"""
+    model_config = _FROZEN
     resource: str
     gender: str
     period: str
@@ -1,7 +1,8 @@
 """Клавиатуры для работы с почтами (новый flow с умным распределением)"""
-from typing import List
+from functools import cache, lru_cache
+from typing import Collection, Tuple
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.keyboards.callbacks import (
     EmailResourceCallback,
@@ -16,11 +17,26 @@ from bot.keyboards.callbacks import (
     EmailTargetResourceToggleCallback,
     EmailTargetResourceConfirmCallback,
     EmailRentalMenuCallback,
+    pack_region,
 )
+from bot.keyboards.inline import _region_markup
 from bot.models.enums import EmailResource, EmailType, EmailMode, EmailTargetResource
 from bot.services.region_service import region_service
 
 
+# Кнопки выбора количества: (текст, значение)
+_QUANTITY_BUTTONS = tuple((str(qty), qty) for qty in range(1, 6))
+
+# Упакованные callback-данные кнопок без переменных полей (pack() один раз при импорте)
+_EMAIL_BACK = {
+    to: EmailBackCallback(to=to).pack()
+    for to in ("main", "email_resource", "email_type", "region", "mode", "target_resources")
+}
+_EMAIL_SEARCH_REGION = EmailSearchRegionCallback().pack()
+_TARGET_RESOURCE_CONFIRM = EmailTargetResourceConfirmCallback().pack()
+
+
+@cache
 def get_email_menu_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора почтового домена (Gmail/Рамблер)"""
     builder = InlineKeyboardBuilder()
@@ -40,13 +56,14 @@ def get_email_menu_keyboard() -> InlineKeyboardMarkup:
     # Кнопка назад в главное меню
     builder.button(
         text="« Назад",
-        callback_data=EmailBackCallback(to="main"),
+        callback_data=_EMAIL_BACK["main"],
     )
 
     builder.adjust(2, 1, 1)
     return builder.as_markup()
 
 
+@cache
 def get_email_type_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора типа Gmail (Любые / только gmail.com)"""
     builder = InlineKeyboardBuilder()
@@ -61,7 +78,7 @@ def get_email_type_keyboard() -> InlineKeyboardMarkup:
     # Кнопка назад к выбору домена
     builder.button(
         text="« Назад",
-        callback_data=EmailBackCallback(to="email_resource"),
+        callback_data=_EMAIL_BACK["email_resource"],
     )
 
     builder.adjust(2, 1)
@@ -74,49 +91,38 @@ def get_email_region_keyboard(email_resource: EmailResource) -> InlineKeyboardMa
     Для Gmail кнопка "Назад" ведёт к выбору типа.
     Для Rambler — к выбору домена.
     """
-    builder = InlineKeyboardBuilder()
-
-    # Получаем отсортированный список регионов из сервиса
-    for region in region_service.get_regions():
-        builder.button(
-            text=region,
-            callback_data=EmailRegionCallback(region=region),
-        )
-
-    # Кнопка поиска
-    builder.button(
-        text="🔍 Поиск",
-        callback_data=EmailSearchRegionCallback(),
-    )
-
     # Кнопка назад: для Gmail — к типу, для Rambler — к ресурсу
-    if email_resource == EmailResource.GMAIL:
-        back_to = "email_type"
-    else:
-        back_to = "email_resource"
-
-    builder.button(
-        text="« Назад",
-        callback_data=EmailBackCallback(to=back_to),
+    back_to = "email_type" if email_resource == EmailResource.GMAIL else "email_resource"
+    return _build_email_region_keyboard(back_to, region_service.version)
+
+
+@lru_cache(maxsize=4)
+def _build_email_region_keyboard(back_to: str, regions_version: int) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры регионов для почт (кэш по цели "Назад" и версии регионов)"""
+    return _region_markup(
+        [
+            InlineKeyboardButton(text=region, callback_data=pack_region(EmailRegionCallback, region))
+            for region in region_service.get_regions_tuple()
+        ],
+        # Поиск и назад — на всю ширину
+        InlineKeyboardButton(text="🔍 Поиск", callback_data=_EMAIL_SEARCH_REGION),
+        InlineKeyboardButton(text="« Назад", callback_data=_EMAIL_BACK[back_to]),
     )
 
-    # Регионы по 3 в ряд, затем поиск и назад по одной кнопке
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1)
-    return builder.as_markup()
-
 
+@cache
 def get_email_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона (для режима поиска)"""
     builder = InlineKeyboardBuilder()
     builder.button(
         text="« Назад к списку регионов",
-        callback_data=EmailBackCallback(to="region"),
+        callback_data=_EMAIL_BACK["region"],
     )
     builder.adjust(1)
     return builder.as_markup()
 
 
+@cache
 def get_email_mode_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора режима (Новая/Эконом)"""
     builder = InlineKeyboardBuilder()
@@ -131,79 +137,91 @@ def get_email_mode_keyboard() -> InlineKeyboardMarkup:
     # Кнопка назад к выбору региона
     builder.button(
         text="« Назад",
-        callback_data=EmailBackCallback(to="region"),
+        callback_data=_EMAIL_BACK["region"],
     )
 
     builder.adjust(2, 1)
     return builder.as_markup()
 
 
-def get_email_target_resource_keyboard(selected: List[str]) -> InlineKeyboardMarkup:
+# Основные целевые ресурсы (OTHER выводится отдельной строкой)
+_MAIN_TARGET_RESOURCES: Tuple[EmailTargetResource, ...] = tuple(
+    r for r in EmailTargetResource if r is not EmailTargetResource.OTHER
+)
+
+# Кнопки ресурсов: (value, текст, упакованный callback), OTHER — последним
+_TARGET_RESOURCE_BUTTONS: Tuple[Tuple[str, str, str], ...] = tuple(
+    (r.value, r.button_text, EmailTargetResourceToggleCallback(resource=r.value).pack())
+    for r in (*_MAIN_TARGET_RESOURCES, EmailTargetResource.OTHER)
+)
+
+# Layout: основные ресурсы по 2, затем Другие, Подтвердить или Назад
+_TARGET_RESOURCE_ROWS = (
+    (2,) * (len(_MAIN_TARGET_RESOURCES) // 2)
+    + (1,) * (len(_MAIN_TARGET_RESOURCES) % 2)
+    + (1, 1)
+)
+
+
+def get_email_target_resource_keyboard(selected: Collection[str]) -> InlineKeyboardMarkup:
     """
     Клавиатура множественного выбора целевых ресурсов для почты.
     Аналогична клавиатуре прокси.
     """
     builder = InlineKeyboardBuilder()
+    selected_set = selected if isinstance(selected, frozenset) else frozenset(selected)
 
-    # Все ресурсы кроме OTHER
-    main_resources = [r for r in EmailTargetResource if r != EmailTargetResource.OTHER]
-    for resource in main_resources:
-        check = "✅ " if resource.value in selected else ""
-        builder.button(
-            text=f"{check}{resource.button_text}",
-            callback_data=EmailTargetResourceToggleCallback(resource=resource.value),
-        )
-
-    # OTHER (Другие) на отдельной строке
-    check = "✅ " if EmailTargetResource.OTHER.value in selected else ""
-    builder.button(
-        text=f"{check}{EmailTargetResource.OTHER.button_text}",
-        callback_data=EmailTargetResourceToggleCallback(resource=EmailTargetResource.OTHER.value),
-    )
+    # Основные ресурсы, затем OTHER (Другие) на отдельной строке
+    for value, text, callback_data in _TARGET_RESOURCE_BUTTONS:
+        check = "✅ " if value in selected_set else ""
+        builder.button(text=f"{check}{text}", callback_data=callback_data)
 
     # Кнопка подтвердить ИЛИ назад (заменяют друг друга)
     if selected:
         builder.button(
             text="✅ Подтвердить",
-            callback_data=EmailTargetResourceConfirmCallback(),
+            callback_data=_TARGET_RESOURCE_CONFIRM,
         )
     else:
         builder.button(
             text="« Назад",
-            callback_data=EmailBackCallback(to="mode"),
+            callback_data=_EMAIL_BACK["mode"],
         )
 
-    # Динамический layout: основные ресурсы по 2, затем Другие, Подтвердить или Назад
-    rows = [2] * (len(main_resources) // 2)
-    if len(main_resources) % 2:
-        rows.append(1)
-    rows.append(1)  # Другие
-    rows.append(1)  # Подтвердить или Назад
-
-    builder.adjust(*rows)
+    builder.adjust(*_TARGET_RESOURCE_ROWS)
     return builder.as_markup()
 
 
+@cache
 def get_email_quantity_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора количества почт"""
     builder = InlineKeyboardBuilder()
 
-    for qty in range(1, 6):
+    for text, qty in _QUANTITY_BUTTONS:
         builder.button(
-            text=str(qty),
+            text=text,
             callback_data=EmailQuantityCallback(quantity=qty),
         )
 
     # Кнопка назад к выбору ресурсов
     builder.button(
         text="« Назад",
-        callback_data=EmailBackCallback(to="target_resources"),
+        callback_data=_EMAIL_BACK["target_resources"],
     )
 
     builder.adjust(5, 1)
     return builder.as_markup()
 
 
+# Кнопки фидбека по почте: (текст, action)
+_EMAIL_FEEDBACK_ACTIONS = (
+    ("🚫 Блок", "block"),
+    ("🔐 Авторизация", "auth"),
+    ("✅ Хороший", "good"),
+    ("⚠️ Дефектный", "defect"),
+)
+
+
 def get_email_feedback_keyboard(
     email_id: str,
     resource: str,
@@ -219,46 +237,17 @@ def get_email_feedback_keyboard(
     - Дефектный: есть проблемы, но можно использовать
     """
     builder = InlineKeyboardBuilder()
-    builder.button(
-        text="🚫 Блок",
-        callback_data=EmailFeedbackCallback(
-            action="block",
-            email_id=email_id,
-            resource=resource,
-            email_type="none",  # Больше не используется, но нужен для совместимости
-            region=region,
-        ),
-    )
-    builder.button(
-        text="🔐 Авторизация",
-        callback_data=EmailFeedbackCallback(
-            action="auth",
-            email_id=email_id,
-            resource=resource,
-            email_type="none",
-            region=region,
-        ),
-    )
-    builder.button(
-        text="✅ Хороший",
-        callback_data=EmailFeedbackCallback(
-            action="good",
-            email_id=email_id,
-            resource=resource,
-            email_type="none",
-            region=region,
-        ),
-    )
-    builder.button(
-        text="⚠️ Дефектный",
-        callback_data=EmailFeedbackCallback(
-            action="defect",
-            email_id=email_id,
-            resource=resource,
-            email_type="none",
-            region=region,
-        ),
-    )
+    for text, action in _EMAIL_FEEDBACK_ACTIONS:
+        builder.button(
+            text=text,
+            callback_data=EmailFeedbackCallback(
+                action=action,
+                email_id=email_id,
+                resource=resource,
+                email_type="none",  # Больше не используется, но нужен для совместимости
+                region=region,
+            ),
+        )
     builder.adjust(2, 2)  # 2 кнопки в первом ряду, 2 во втором
     return builder.as_markup()
 
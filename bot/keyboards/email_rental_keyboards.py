@@ -1,5 +1,6 @@
 """Клавиатуры для аренды временных почт через quix.email"""
-from typing import List, Dict, Any
+from functools import cache
+from typing import Any, Dict, List, Tuple
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardMarkup
 
@@ -14,13 +15,26 @@ from bot.keyboards.callbacks import (
 # Количество доменов на одной странице
 DOMAINS_PER_PAGE = 12
 
+# Ряды кнопок доменов (по 2) для каждого возможного числа доменов на странице
+_DOMAIN_ROWS: Tuple[Tuple[int, ...], ...] = tuple(
+    (2,) * (count // 2) + (1,) * (count % 2)
+    for count in range(DOMAINS_PER_PAGE + 1)
+)
+
+# Упакованные callback-данные кнопок "Назад" (pack() один раз при импорте)
+_RENTAL_BACK = {
+    to: EmailRentalBackCallback(to=to).pack()
+    for to in ("email_menu", "enter_site")
+}
+
 
+@cache
 def get_email_rental_enter_site_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура для ввода домена сайта (только кнопка назад)"""
     builder = InlineKeyboardBuilder()
     builder.button(
         text="« Назад",
-        callback_data=EmailRentalBackCallback(to="email_menu"),
+        callback_data=_RENTAL_BACK["email_menu"],
     )
     builder.adjust(1)
     return builder.as_markup()
@@ -42,31 +56,26 @@ def get_email_rental_domains_keyboard(
     # Вычисляем пагинацию
     total_pages = (len(domains) + DOMAINS_PER_PAGE - 1) // DOMAINS_PER_PAGE
     start_idx = page * DOMAINS_PER_PAGE
-    end_idx = min(start_idx + DOMAINS_PER_PAGE, len(domains))
-    page_domains = domains[start_idx:end_idx]
+    page_domains = domains[start_idx:start_idx + DOMAINS_PER_PAGE]  # Срез сам обрезается по длине списка
 
     # Кнопки доменов
     for domain_info in page_domains:
         domain = domain_info.get("domain", "")
         quantity = domain_info.get("quantity", 0)
-        price = domain_info.get("price", 0)
 
         # Формат: "gmail.com (5)" где 5 - количество
-        if quantity > 0:
-            text = f"{domain} ({quantity})"
-        else:
-            text = domain
-
+        text = f"{domain} ({quantity})" if quantity > 0 else domain
         builder.button(
             text=text,
             callback_data=EmailRentalDomainCallback(domain=domain),
         )
 
-    # Кнопки пагинации (если нужны)
+    # Кнопки пагинации (если нужны); на одной странице — только "Назад" после доменов
+    tail_rows: Tuple[int, ...] = (1,)
     if total_pages > 1:
-        nav_buttons = []
-
-        if page > 0:
+        has_prev = page > 0
+        has_next = page < total_pages - 1
+        if has_prev:
             builder.button(
                 text="◀️",
                 callback_data=EmailRentalDomainPageCallback(page=page - 1),
@@ -77,36 +86,23 @@ def get_email_rental_domains_keyboard(
             callback_data=EmailRentalDomainPageCallback(page=page),  # Текущая страница
         )
 
-        if page < total_pages - 1:
+        if has_next:
             builder.button(
                 text="▶️",
                 callback_data=EmailRentalDomainPageCallback(page=page + 1),
             )
 
+        # Кнопки навигации: prev, current, next (или меньше), затем назад
+        tail_rows = (1 + has_prev + has_next, 1)
+
     # Кнопка назад
     builder.button(
         text="« Назад",
-        callback_data=EmailRentalBackCallback(to="enter_site"),
+        callback_data=_RENTAL_BACK["enter_site"],
     )
 
     # Layout: домены по 2, затем навигация, затем назад
-    domains_count = len(page_domains)
-    rows = [2] * (domains_count // 2)
-    if domains_count % 2:
-        rows.append(1)
-
-    if total_pages > 1:
-        # Кнопки навигации: prev, current, next (или меньше)
-        nav_count = 1  # минимум текущая страница
-        if page > 0:
-            nav_count += 1
-        if page < total_pages - 1:
-            nav_count += 1
-        rows.append(nav_count)
-
-    rows.append(1)  # Назад
-
-    builder.adjust(*rows)
+    builder.adjust(*_DOMAIN_ROWS[len(page_domains)], *tail_rows)
     return builder.as_markup()
 
 
@@ -163,12 +159,13 @@ def get_email_rental_timeout_keyboard(
     return builder.as_markup()
 
 
+@cache
 def get_email_rental_error_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура при ошибке (только назад)"""
     builder = InlineKeyboardBuilder()
     builder.button(
         text="« Назад в меню почт",
-        callback_data=EmailRentalBackCallback(to="email_menu"),
+        callback_data=_RENTAL_BACK["email_menu"],
     )
     builder.adjust(1)
     return builder.as_markup()
@@ -1,5 +1,8 @@
+from functools import cache, lru_cache
+from typing import List, Optional
+
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.keyboards.callbacks import (
     AdminApprovalCallback,
@@ -28,9 +31,31 @@ from bot.keyboards.callbacks import (
     NumberMenuCallback,
     # Почты
     EmailMenuCallback,
+    # Очистка буфера
+    BufferClearCategoryCallback,
+    BufferClearResourceCallback,
+    BufferClearTypeCallback,
+    BufferClearConfirmCallback,
+    BufferClearBackCallback,
+    # Освобождение буфера
+    BufferReleaseCategoryCallback,
+    BufferReleaseResourceCallback,
+    BufferReleaseConfirmCallback,
+    BufferReleaseBackCallback,
+    pack_region,
 )
 from bot.models.enums import Resource, Gender, EmailResource
-from bot.services.region_service import region_service
+from bot.services.region_service import REGIONS_PER_ROW, region_service
+
+
+# Кнопки выбора количества: (текст, значение)
+_QUANTITY_BUTTONS = tuple((str(qty), qty) for qty in range(1, 6))
+
+# Ресурсы аккаунтов без Gmail (Gmail выдаётся через раздел почт)
+_NON_GMAIL_RESOURCES = tuple(r for r in Resource if r is not Resource.GMAIL)
+
+# Ресурсы без выбора пола/типа (проверяются члены Resource)
+_NO_GENDER_RESOURCES = frozenset({Resource.VK, Resource.OK})
 
 
 def get_admin_approval_keyboard(user_id: int) -> InlineKeyboardMarkup:
@@ -48,16 +73,16 @@ def get_admin_approval_keyboard(user_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_resource_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса"""
     builder = InlineKeyboardBuilder()
     # Добавляем все ресурсы кроме Gmail
-    for resource in Resource:
-        if resource != Resource.GMAIL:
-            builder.button(
-                text=resource.button_text,
-                callback_data=ResourceCallback(resource=resource.value),
-            )
+    for resource in _NON_GMAIL_RESOURCES:
+        builder.button(
+            text=resource.button_text,
+            callback_data=ResourceCallback(resource=resource.value),
+        )
     # Кнопка почт (вместо прямого Gmail)
     builder.button(
         text="📧 Почты",
@@ -78,37 +103,50 @@ def get_resource_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+def _region_markup(
+    region_buttons: List[InlineKeyboardButton],
+    *extra_buttons: InlineKeyboardButton,
+) -> InlineKeyboardMarkup:
+    """
+    Клавиатура регионов без InlineKeyboardBuilder: регионы по 3 в ряд,
+    затем extra_buttons по одной на строку.
+
+    Раскладка совпадает с adjust(3, ..., 1, 1): неполный последний ряд
+    регионов добирается следующими кнопками.
+    """
+    buttons = [*region_buttons, *extra_buttons]
+    regions_end = len(region_service.get_keyboard_rows()) * REGIONS_PER_ROW
+    rows = [buttons[i:i + REGIONS_PER_ROW] for i in range(0, regions_end, REGIONS_PER_ROW)]
+    rows.extend([button] for button in buttons[regions_end:])
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
 def get_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора региона"""
-    builder = InlineKeyboardBuilder()
-    # Получаем отсортированный список регионов из сервиса
-    for region in region_service.get_regions():
-        builder.button(
-            text=region,
-            callback_data=RegionCallback(region=region),
-        )
-    # Кнопка поиска (на всю ширину)
-    builder.button(
-        text="🔍 Поиск",
-        callback_data=SearchRegionCallback(),
-    )
-    # Кнопка назад (на всю ширину)
-    builder.button(
-        text="« Назад",
-        callback_data=BackCallback(to="resource"),
+    return _build_region_keyboard(region_service.version)
+
+
+@lru_cache(maxsize=4)
+def _build_region_keyboard(regions_version: int) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры регионов (кэш по версии регионов)"""
+    return _region_markup(
+        [
+            InlineKeyboardButton(text=region, callback_data=pack_region(RegionCallback, region))
+            for region in region_service.get_regions_tuple()
+        ],
+        # Поиск и назад — на всю ширину
+        InlineKeyboardButton(text="🔍 Поиск", callback_data=SearchRegionCallback().pack()),
+        InlineKeyboardButton(text="« Назад", callback_data=BackCallback(to="resource").pack()),
     )
-    # Регионы по 3 в ряд, затем поиск и назад по одной кнопке на строку
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1)
-    return builder.as_markup()
 
 
+@cache
 def get_quantity_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора количества"""
     builder = InlineKeyboardBuilder()
-    for qty in range(1, 6):
+    for text, qty in _QUANTITY_BUTTONS:
         builder.button(
-            text=str(qty),
+            text=text,
             callback_data=QuantityCallback(quantity=qty),
         )
     # Кнопка назад
@@ -120,10 +158,11 @@ def get_quantity_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_gender_keyboard(resource: Resource) -> InlineKeyboardMarkup:
+@cache  # Ключ — член Resource: по одной клавиатуре на ресурс
+def get_gender_keyboard(resource: Resource) -> Optional[InlineKeyboardMarkup]:
     """Клавиатура выбора пола/типа. Возвращает None для VK и OK."""
     # Для VK и OK пол не выбирается
-    if resource in (Resource.VK, Resource.OK):
+    if resource in _NO_GENDER_RESOURCES:
         return None
 
     builder = InlineKeyboardBuilder()
@@ -158,31 +197,29 @@ def get_gender_keyboard(resource: Resource) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+# Кнопки фидбека по аккаунту: (текст, action)
+_ACCOUNT_FEEDBACK_ACTIONS = (
+    ("🚫 Блок", "block"),
+    ("✅ Хороший", "good"),
+    ("⚠️ Дефектный", "defect"),
+)
+
+
 def get_feedback_keyboard(account_id: str, resource: str, gender: str, region: str) -> InlineKeyboardMarkup:
     """Клавиатура фидбека по аккаунту"""
     builder = InlineKeyboardBuilder()
-    builder.button(
-        text="🚫 Блок",
-        callback_data=AccountFeedbackCallback(
-            action="block", account_id=account_id, resource=resource, gender=gender, region=region
-        ),
-    )
-    builder.button(
-        text="✅ Хороший",
-        callback_data=AccountFeedbackCallback(
-            action="good", account_id=account_id, resource=resource, gender=gender, region=region
-        ),
-    )
-    builder.button(
-        text="⚠️ Дефектный",
-        callback_data=AccountFeedbackCallback(
-            action="defect", account_id=account_id, resource=resource, gender=gender, region=region
-        ),
-    )
+    for text, action in _ACCOUNT_FEEDBACK_ACTIONS:
+        builder.button(
+            text=text,
+            callback_data=AccountFeedbackCallback(
+                action=action, account_id=account_id, resource=resource, gender=gender, region=region
+            ),
+        )
     builder.adjust(3)
     return builder.as_markup()
 
 
+@lru_cache(maxsize=256)  # Ресурс × пол × регион — немного вариантов
 def get_replace_keyboard(resource: str, gender: str, region: str) -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой замены аккаунта"""
     builder = InlineKeyboardBuilder()
@@ -194,6 +231,7 @@ def get_replace_keyboard(resource: str, gender: str, region: str) -> InlineKeybo
     return builder.as_markup()
 
 
+@cache
 def get_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона (для режима поиска)"""
     builder = InlineKeyboardBuilder()
@@ -206,17 +244,20 @@ def get_back_to_region_keyboard() -> InlineKeyboardMarkup:
 
 
 # === Клавиатуры для статистики ===
-
-def get_stat_resource_keyboard() -> InlineKeyboardMarkup:
-    """Клавиатура выбора ресурса для статистики (VK, Mamba, OK + разделы Почты/Номера)"""
-    builder = InlineKeyboardBuilder()
+# Клавиатуры статистики не зависят от пользователя, поэтому кэшируются.
+# Кэшированная разметка — один общий объект на всех вызывающих, а
+# InlineKeyboardMarkup в aiogram изменяемый (inline_keyboard — обычные списки):
+# возвращённую клавиатуру нельзя изменять, только отправлять как есть.
+# Клавиатуры регионов кэшируются по версии списка регионов из region_service.
+
+def _add_stat_resource_buttons(builder: InlineKeyboardBuilder) -> None:
+    """Кнопки выбора ресурса статистики (VK, Mamba, OK + разделы Почты/Номера)"""
     # Основные ресурсы (без Gmail - он теперь в разделе Почты)
-    for resource in Resource:
-        if resource != Resource.GMAIL:
-            builder.button(
-                text=resource.button_text,
-                callback_data=StatResourceCallback(resource=resource.value),
-            )
+    for resource in _NON_GMAIL_RESOURCES:
+        builder.button(
+            text=resource.button_text,
+            callback_data=StatResourceCallback(resource=resource.value),
+        )
     # Раздел Почты
     builder.button(
         text="📧 Почты",
@@ -227,15 +268,23 @@ def get_stat_resource_keyboard() -> InlineKeyboardMarkup:
         text="📱 Номера",
         callback_data=StatNumberMenuCallback(action="open"),
     )
+
+
+@cache
+def get_stat_resource_keyboard() -> InlineKeyboardMarkup:
+    """Клавиатура выбора ресурса для статистики (VK, Mamba, OK + разделы Почты/Номера)"""
+    builder = InlineKeyboardBuilder()
+    _add_stat_resource_buttons(builder)
     # VK, Mamba, OK по 2 в ряд, затем Почты и Номера
     builder.adjust(2, 1, 2)
     return builder.as_markup()
 
 
-def get_stat_gender_keyboard(resource: Resource) -> InlineKeyboardMarkup:
+@cache  # Ключ — член Resource: по одной клавиатуре на ресурс
+def get_stat_gender_keyboard(resource: Resource) -> Optional[InlineKeyboardMarkup]:
     """Клавиатура выбора пола/типа для статистики. Возвращает None для VK и OK."""
     # Для VK и OK пол не выбирается
-    if resource in (Resource.VK, Resource.OK):
+    if resource in _NO_GENDER_RESOURCES:
         return None
 
     builder = InlineKeyboardBuilder()
@@ -270,37 +319,25 @@ def get_stat_gender_keyboard(resource: Resource) -> InlineKeyboardMarkup:
 
 def get_stat_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора региона для статистики (с кнопкой 'Все регионы')"""
-    builder = InlineKeyboardBuilder()
+    return _build_stat_region_keyboard("gender", region_service.version)
 
-    # Получаем отсортированный список регионов из сервиса
-    for region in region_service.get_regions():
-        builder.button(
-            text=region,
-            callback_data=StatRegionCallback(region=region),
-        )
-
-    # Кнопка поиска
-    builder.button(
-        text="🔍 Поиск",
-        callback_data=StatSearchRegionCallback(),
-    )
-    # Кнопка "Все регионы" на всю ширину
-    builder.button(
-        text="🌍 Все регионы",
-        callback_data=StatRegionCallback(region="all"),
-    )
-    # Кнопка назад
-    builder.button(
-        text="« Назад",
-        callback_data=StatBackCallback(to="gender"),
-    )
 
+@lru_cache(maxsize=8)
+def _build_stat_region_keyboard(back_to: str, regions_version: int) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры регионов статистики (кэш по цели "Назад" и версии регионов)"""
     # Layout: регионы по 3, затем поиск (1), все регионы (1), назад (1)
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1, 1)
-    return builder.as_markup()
+    return _region_markup(
+        [
+            InlineKeyboardButton(text=region, callback_data=pack_region(StatRegionCallback, region))
+            for region in region_service.get_regions_tuple()
+        ],
+        InlineKeyboardButton(text="🔍 Поиск", callback_data=StatSearchRegionCallback().pack()),
+        InlineKeyboardButton(text="🌍 Все регионы", callback_data=StatRegionCallback(region="all").pack()),
+        InlineKeyboardButton(text="« Назад", callback_data=StatBackCallback(to=back_to).pack()),
+    )
 
 
+@cache
 def get_stat_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона в статистике"""
     builder = InlineKeyboardBuilder()
@@ -312,43 +349,65 @@ def get_stat_back_to_region_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_stat_period_keyboard() -> InlineKeyboardMarkup:
-    """Клавиатура выбора периода для статистики"""
+# Кнопки выбора периода: (текст, period)
+_STAT_PERIODS = (
+    ("📅 За день", "day"),
+    ("📆 За неделю", "week"),
+    ("🗓 За месяц", "month"),
+)
+
+
+@cache  # Ключ — цель кнопки "Назад": по одной клавиатуре на раздел статистики
+def _build_stat_period_keyboard(back_to: str) -> InlineKeyboardMarkup:
+    """Клавиатура выбора периода: три периода в ряд и "Назад" к выбору региона раздела"""
     builder = InlineKeyboardBuilder()
-    builder.button(
-        text="📅 За день",
-        callback_data=StatPeriodCallback(period="day"),
-    )
-    builder.button(
-        text="📆 За неделю",
-        callback_data=StatPeriodCallback(period="week"),
-    )
-    builder.button(
-        text="🗓 За месяц",
-        callback_data=StatPeriodCallback(period="month"),
-    )
+    for text, period in _STAT_PERIODS:
+        builder.button(
+            text=text,
+            callback_data=StatPeriodCallback(period=period),
+        )
     # Кнопка назад
     builder.button(
         text="« Назад",
-        callback_data=StatBackCallback(to="region"),
+        callback_data=StatBackCallback(to=back_to),
     )
     builder.adjust(3, 1)
     return builder.as_markup()
 
 
+def get_stat_period_keyboard() -> InlineKeyboardMarkup:
+    """Клавиатура выбора периода для статистики"""
+    return _build_stat_period_keyboard("region")
+
+
+@lru_cache(maxsize=64)
 def get_stat_detailed_keyboard(resource: str, gender: str, period: str) -> InlineKeyboardMarkup:
-    """Клавиатура с кнопкой 'Детальнее по регионам' для общей статистики"""
+    """Клавиатура под общей статистикой: 'Детальнее по регионам' и выбор ресурса для новой"""
     builder = InlineKeyboardBuilder()
     builder.button(
         text="📊 Детальнее по регионам",
         callback_data=StatDetailedByRegionsCallback(resource=resource, gender=gender, period=period),
     )
+    _add_stat_resource_buttons(builder)
+    builder.adjust(1, 2, 1, 2)
+    return builder.as_markup()
+
+
+@cache
+def get_stat_back_to_menu_keyboard() -> InlineKeyboardMarkup:
+    """Клавиатура с кнопкой возврата в главное меню статистики (под результатом)"""
+    builder = InlineKeyboardBuilder()
+    builder.button(
+        text="« Назад к меню",
+        callback_data=StatBackCallback(to="resource"),
+    )
     builder.adjust(1)
     return builder.as_markup()
 
 
 # === Клавиатуры для статистики почт ===
 
+@cache
 def get_stat_email_resource_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора почтового ресурса для статистики (Gmail/Rambler)"""
     builder = InlineKeyboardBuilder()
@@ -366,6 +425,7 @@ def get_stat_email_resource_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_stat_email_type_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора типа Gmail для статистики (Любые/gmail.com)"""
     builder = InlineKeyboardBuilder()
@@ -387,36 +447,11 @@ def get_stat_email_type_keyboard() -> InlineKeyboardMarkup:
 
 
 def get_stat_email_region_keyboard() -> InlineKeyboardMarkup:
-    """Клавиатура выбора региона для статистики почт"""
-    builder = InlineKeyboardBuilder()
-
-    for region in region_service.get_regions():
-        builder.button(
-            text=region,
-            callback_data=StatRegionCallback(region=region),
-        )
-
-    # Кнопка поиска
-    builder.button(
-        text="🔍 Поиск",
-        callback_data=StatSearchRegionCallback(),
-    )
-    # Кнопка "Все регионы"
-    builder.button(
-        text="🌍 Все регионы",
-        callback_data=StatRegionCallback(region="all"),
-    )
-    # Кнопка назад к типу/ресурсу почты
-    builder.button(
-        text="« Назад",
-        callback_data=StatBackCallback(to="email_type"),
-    )
-
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1, 1)
-    return builder.as_markup()
+    """Клавиатура выбора региона для статистики почт (назад — к типу/ресурсу почты)"""
+    return _build_stat_region_keyboard("email_type", region_service.version)
 
 
+@cache
 def get_stat_email_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона в статистике почт"""
     builder = InlineKeyboardBuilder()
@@ -430,61 +465,17 @@ def get_stat_email_back_to_region_keyboard() -> InlineKeyboardMarkup:
 
 def get_stat_email_period_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора периода для статистики почт"""
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="📅 За день",
-        callback_data=StatPeriodCallback(period="day"),
-    )
-    builder.button(
-        text="📆 За неделю",
-        callback_data=StatPeriodCallback(period="week"),
-    )
-    builder.button(
-        text="🗓 За месяц",
-        callback_data=StatPeriodCallback(period="month"),
-    )
-    # Кнопка назад
-    builder.button(
-        text="« Назад",
-        callback_data=StatBackCallback(to="email_region"),
-    )
-    builder.adjust(3, 1)
-    return builder.as_markup()
+    return _build_stat_period_keyboard("email_region")
 
 
 # === Клавиатуры для статистики номеров ===
 
 def get_stat_number_region_keyboard() -> InlineKeyboardMarkup:
-    """Клавиатура выбора региона для статистики номеров"""
-    builder = InlineKeyboardBuilder()
-
-    for region in region_service.get_regions():
-        builder.button(
-            text=region,
-            callback_data=StatRegionCallback(region=region),
-        )
-
-    # Кнопка поиска
-    builder.button(
-        text="🔍 Поиск",
-        callback_data=StatSearchRegionCallback(),
-    )
-    # Кнопка "Все регионы"
-    builder.button(
-        text="🌍 Все регионы",
-        callback_data=StatRegionCallback(region="all"),
-    )
-    # Кнопка назад к главному меню статистики
-    builder.button(
-        text="« Назад",
-        callback_data=StatBackCallback(to="resource"),
-    )
-
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1, 1)
-    return builder.as_markup()
+    """Клавиатура выбора региона для статистики номеров (назад — к главному меню статистики)"""
+    return _build_stat_region_keyboard("resource", region_service.version)
 
 
+@cache
 def get_stat_number_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона в статистике номеров"""
     builder = InlineKeyboardBuilder()
@@ -498,39 +489,12 @@ def get_stat_number_back_to_region_keyboard() -> InlineKeyboardMarkup:
 
 def get_stat_number_period_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора периода для статистики номеров"""
-    builder = InlineKeyboardBuilder()
-    builder.button(
-        text="📅 За день",
-        callback_data=StatPeriodCallback(period="day"),
-    )
-    builder.button(
-        text="📆 За неделю",
-        callback_data=StatPeriodCallback(period="week"),
-    )
-    builder.button(
-        text="🗓 За месяц",
-        callback_data=StatPeriodCallback(period="month"),
-    )
-    # Кнопка назад
-    builder.button(
-        text="« Назад",
-        callback_data=StatBackCallback(to="number_region"),
-    )
-    builder.adjust(3, 1)
-    return builder.as_markup()
+    return _build_stat_period_keyboard("number_region")
 
 
 # === Клавиатуры для очистки буфера (админ) ===
 
-from bot.keyboards.callbacks import (
-    BufferClearCategoryCallback,
-    BufferClearResourceCallback,
-    BufferClearTypeCallback,
-    BufferClearConfirmCallback,
-    BufferClearBackCallback,
-)
-
-
+@cache
 def get_buffer_clear_category_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора категории для очистки буфера"""
     builder = InlineKeyboardBuilder()
@@ -550,6 +514,7 @@ def get_buffer_clear_category_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_clear_accounts_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса аккаунтов для очистки"""
     builder = InlineKeyboardBuilder()
@@ -581,6 +546,7 @@ def get_buffer_clear_accounts_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_clear_emails_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса почт для очистки"""
     builder = InlineKeyboardBuilder()
@@ -604,6 +570,7 @@ def get_buffer_clear_emails_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_clear_type_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора типа очистки"""
     builder = InlineKeyboardBuilder()
@@ -631,6 +598,7 @@ def get_buffer_clear_type_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_clear_confirm_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура подтверждения очистки"""
     builder = InlineKeyboardBuilder()
@@ -648,14 +616,7 @@ def get_buffer_clear_confirm_keyboard() -> InlineKeyboardMarkup:
 
 # === Клавиатуры для освобождения буфера (возврат в базу) ===
 
-from bot.keyboards.callbacks import (
-    BufferReleaseCategoryCallback,
-    BufferReleaseResourceCallback,
-    BufferReleaseConfirmCallback,
-    BufferReleaseBackCallback,
-)
-
-
+@cache
 def get_buffer_release_category_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора категории для освобождения буфера"""
     builder = InlineKeyboardBuilder()
@@ -675,6 +636,7 @@ def get_buffer_release_category_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_release_numbers_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса номеров для освобождения"""
     builder = InlineKeyboardBuilder()
@@ -694,6 +656,7 @@ def get_buffer_release_numbers_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_release_accounts_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса аккаунтов для освобождения"""
     builder = InlineKeyboardBuilder()
@@ -725,6 +688,7 @@ def get_buffer_release_accounts_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_release_emails_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса почт для освобождения"""
     builder = InlineKeyboardBuilder()
@@ -748,6 +712,7 @@ def get_buffer_release_emails_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_buffer_release_confirm_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура подтверждения освобождения"""
     builder = InlineKeyboardBuilder()
@@ -1,5 +1,6 @@
 """Клавиатуры для работы с номерами телефонов"""
-from typing import List
+from functools import cache, lru_cache
+from typing import Collection, FrozenSet
 
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardMarkup
@@ -19,8 +20,20 @@ from bot.models.enums import NumberResource, NumberStatus
 from bot.services.region_service import region_service
 
 
-def get_number_resource_keyboard(selected: List[str]) -> InlineKeyboardMarkup:
+# Кнопки выбора количества: (текст, значение)
+_QUANTITY_BUTTONS = tuple((str(qty), qty) for qty in range(1, 6))
+
+
+def get_number_resource_keyboard(selected: Collection[str]) -> InlineKeyboardMarkup:
     """Клавиатура множественного выбора ресурсов для номеров"""
+    return _build_number_resource_keyboard(
+        selected if isinstance(selected, frozenset) else frozenset(selected)
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_number_resource_keyboard(selected: FrozenSet[str]) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры ресурсов для номеров (кэш по набору выбранных)"""
     builder = InlineKeyboardBuilder()
 
     for resource in NumberResource:
@@ -54,10 +67,15 @@ def get_number_resource_keyboard(selected: List[str]) -> InlineKeyboardMarkup:
 
 def get_number_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора региона для номеров"""
+    return _build_number_region_keyboard(region_service.version)
+
+
+@lru_cache(maxsize=4)
+def _build_number_region_keyboard(regions_version: int) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры регионов для номеров (кэш по версии регионов)"""
     builder = InlineKeyboardBuilder()
 
-    # Получаем отсортированный список регионов
-    for region in region_service.get_regions():
+    for region in region_service.get_regions_tuple():
         builder.button(
             text=region,
             callback_data=NumberRegionCallback(region=region),
@@ -76,11 +94,11 @@ def get_number_region_keyboard() -> InlineKeyboardMarkup:
     )
 
     # Layout: регионы по 3, затем поиск и назад по одной
-    regions_count = len(region_service.get_regions())
-    builder.adjust(*([3] * (regions_count // 3 + (1 if regions_count % 3 else 0))), 1, 1)
+    builder.adjust(*region_service.get_keyboard_rows(), 1, 1)
     return builder.as_markup()
 
 
+@cache
 def get_number_back_to_region_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой возврата к выбору региона"""
     builder = InlineKeyboardBuilder()
@@ -92,13 +110,14 @@ def get_number_back_to_region_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_number_quantity_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора количества номеров"""
     builder = InlineKeyboardBuilder()
 
-    for qty in range(1, 6):
+    for text, qty in _QUANTITY_BUTTONS:
         builder.button(
-            text=str(qty),
+            text=text,
             callback_data=NumberQuantityCallback(quantity=qty),
         )
 
@@ -112,6 +131,7 @@ def get_number_quantity_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_number_today_mode_keyboard(today_only: bool) -> InlineKeyboardMarkup:
     """Клавиатура для переключения режима today_only"""
     builder = InlineKeyboardBuilder()
@@ -1,6 +1,7 @@
-from typing import List, Dict, Set
+from functools import cache, lru_cache
+from typing import Collection, Dict, FrozenSet, List, Set, Tuple
 from aiogram.utils.keyboard import InlineKeyboardBuilder
-from aiogram.types import InlineKeyboardMarkup
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from bot.keyboards.callbacks import (
     ProxyMenuCallback,
@@ -24,7 +25,22 @@ from bot.models.proxy import Proxy
 # Количество прокси на странице (2x5 сетка)
 PROXIES_PER_PAGE = 10
 
+# Основные ресурсы (все кроме OTHER) и их раскладка: по 2 в ряд, нечётный — отдельно
+_PROXY_MAIN_RESOURCES = tuple(r for r in ProxyResource if r != ProxyResource.OTHER)
+_PROXY_MAIN_ROWS = (2,) * (len(_PROXY_MAIN_RESOURCES) // 2) + (1,) * (len(_PROXY_MAIN_RESOURCES) % 2)
 
+# Заранее упакованные callback_data статичных кнопок
+_PROXY_BACK = {
+    to: ProxyBackCallback(to=to).pack()
+    for to in ("main", "menu", "resource", "country", "type")
+}
+# Префиксы callback-ов, которые упаковываются вручную в клавиатурах списка прокси
+_PROXY_SELECT_PREFIX = f"{ProxySelectCallback.__prefix__}{ProxySelectCallback.__separator__}"
+_PROXY_TOGGLE_PREFIX = f"{ProxyToggleCallback.__prefix__}{ProxyToggleCallback.__separator__}"
+_PROXY_PAGE_PREFIX = f"{ProxyPageCallback.__prefix__}{ProxyPageCallback.__separator__}"
+
+
+@cache
 def get_proxy_menu_keyboard() -> InlineKeyboardMarkup:
     """Главное меню прокси: добавить или получить"""
     builder = InlineKeyboardBuilder()
@@ -38,19 +54,19 @@ def get_proxy_menu_keyboard() -> InlineKeyboardMarkup:
     )
     builder.button(
         text="« Назад",
-        callback_data=ProxyBackCallback(to="main"),
+        callback_data=_PROXY_BACK["main"],
     )
     builder.adjust(1)
     return builder.as_markup()
 
 
+@cache
 def get_proxy_resource_keyboard(mode: str) -> InlineKeyboardMarkup:
     """Клавиатура выбора ресурса для прокси"""
     builder = InlineKeyboardBuilder()
 
     # Все ресурсы кроме OTHER
-    main_resources = [r for r in ProxyResource if r != ProxyResource.OTHER]
-    for resource in main_resources:
+    for resource in _PROXY_MAIN_RESOURCES:
         builder.button(
             text=resource.button_text,
             callback_data=ProxyResourceCallback(resource=resource.value, mode=mode),
@@ -66,19 +82,15 @@ def get_proxy_resource_keyboard(mode: str) -> InlineKeyboardMarkup:
     back_to = "main" if mode == "get" else "menu"
     builder.button(
         text="« Назад",
-        callback_data=ProxyBackCallback(to=back_to),
+        callback_data=_PROXY_BACK[back_to],
     )
 
-    # Динамический layout: основные ресурсы по 2, затем Другие и Назад по 1
-    rows = [2] * (len(main_resources) // 2)
-    if len(main_resources) % 2:
-        rows.append(1)
-    rows.extend([1, 1])  # Другие + Назад
-
-    builder.adjust(*rows)
+    # Layout: основные ресурсы по 2, затем Другие и Назад по 1
+    builder.adjust(*_PROXY_MAIN_ROWS, 1, 1)
     return builder.as_markup()
 
 
+@cache
 def get_proxy_duration_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора срока действия прокси"""
     builder = InlineKeyboardBuilder()
@@ -90,98 +102,103 @@ def get_proxy_duration_keyboard() -> InlineKeyboardMarkup:
     # Кнопка назад
     builder.button(
         text="« Назад",
-        callback_data=ProxyBackCallback(to="resource"),
+        callback_data=_PROXY_BACK["resource"],
     )
     builder.adjust(4, 1)
     return builder.as_markup()
 
 
 def get_proxy_countries_keyboard(countries: Dict[str, int]) -> InlineKeyboardMarkup:
-    """Клавиатура выбора страны с количеством прокси"""
-    builder = InlineKeyboardBuilder()
+    """
+    Клавиатура выбора страны с количеством прокси.
 
-    # Сортируем по количеству (больше = выше)
-    sorted_countries = sorted(countries.items(), key=lambda x: x[1], reverse=True)
+    Страны выводятся в порядке словаря: get_countries_with_counts уже
+    отдаёт их по убыванию количества (больше = выше).
+    """
+    builder = InlineKeyboardBuilder()
 
-    for country_code, count in sorted_countries:
-        flag = get_country_flag(country_code)
-        name = get_country_name(country_code)
-        builder.button(
-            text=f"{flag} {name} ({count})",
-            callback_data=ProxyCountryCallback(country=country_code),
-        )
+    # По 2 в ряд для стран (т.к. с названиями длиннее) — ряды собираются сразу, без adjust()
+    builder.row(
+        *(
+            InlineKeyboardButton(
+                text=f"{get_country_flag(country_code)} {get_country_name(country_code)} ({count})",
+                callback_data=ProxyCountryCallback(country=country_code).pack(),
+            )
+            for country_code, count in countries.items()
+        ),
+        width=2,
+    )
 
     # Кнопка назад к выбору ресурса
-    builder.button(
+    builder.row(InlineKeyboardButton(
         text="« Назад",
-        callback_data=ProxyBackCallback(to="resource"),
-    )
+        callback_data=_PROXY_BACK["resource"],
+    ))
 
-    # Раскладка: по 2 в ряд для стран (т.к. с названиями длиннее), затем кнопка назад
-    rows = [2] * (len(sorted_countries) // 2)
-    if len(sorted_countries) % 2:
-        rows.append(1)
-    rows.append(1)  # Кнопка назад
-
-    builder.adjust(*rows)
     return builder.as_markup()
 
 
-def get_proxy_list_keyboard(
-    proxies: List[Proxy],
-    country: str,
-    page: int = 0,
-) -> InlineKeyboardMarkup:
-    """Клавиатура списка прокси с пагинацией"""
-    builder = InlineKeyboardBuilder()
-
-    total_pages = (len(proxies) + PROXIES_PER_PAGE - 1) // PROXIES_PER_PAGE
+def _proxy_page(proxies: List[Proxy], page: int) -> Tuple[List[Proxy], int]:
+    """Прокси текущей страницы и общее количество страниц"""
+    full_pages, rest = divmod(len(proxies), PROXIES_PER_PAGE)
     start_idx = page * PROXIES_PER_PAGE
-    end_idx = min(start_idx + PROXIES_PER_PAGE, len(proxies))
-
-    page_proxies = proxies[start_idx:end_idx]
+    return proxies[start_idx:start_idx + PROXIES_PER_PAGE], full_pages + (1 if rest else 0)
 
-    # Кнопки прокси
-    for proxy in page_proxies:
-        flag = get_country_flag(proxy.country)
-        text = f"{proxy.ip_short} {flag} ({proxy.days_left}д)"
-        builder.button(
-            text=text,
-            callback_data=ProxySelectCallback(row_index=proxy.row_index),
-        )
 
-    # По 2 прокси в ряд
-    proxy_rows = [2] * (len(page_proxies) // 2)
-    if len(page_proxies) % 2:
-        proxy_rows.append(1)
+def _proxy_pagination_row(country: str, page: int, total_pages: int) -> List[InlineKeyboardButton]:
+    """Ряд кнопок пагинации списка прокси (пустой, если страница одна)"""
+    # ProxyPageCallback упаковывается вручную: prefix:page:country
+    separator = ProxyPageCallback.__separator__
+    if separator in country:
+        raise ValueError(f"Separator symbol {separator!r} can not be used in country {country!r}")
 
-    # Пагинация
-    pagination_buttons = []
+    row = []
     if page > 0:
-        pagination_buttons.append(("« Пред", page - 1))
+        row.append(InlineKeyboardButton(
+            text="« Пред",
+            callback_data=f"{_PROXY_PAGE_PREFIX}{page - 1}{separator}{country}",
+        ))
     if page < total_pages - 1:
-        pagination_buttons.append(("След »", page + 1))
+        row.append(InlineKeyboardButton(
+            text="След »",
+            callback_data=f"{_PROXY_PAGE_PREFIX}{page + 1}{separator}{country}",
+        ))
+    return row
 
-    for text, pg in pagination_buttons:
-        builder.button(
-            text=text,
-            callback_data=ProxyPageCallback(page=pg, country=country),
+
+def get_proxy_list_keyboard(
+    proxies: List[Proxy],
+    country: str,
+    page: int = 0,
+) -> InlineKeyboardMarkup:
+    """Клавиатура списка прокси с пагинацией (ряды собираются сразу, без InlineKeyboardBuilder)"""
+    page_proxies, total_pages = _proxy_page(proxies, page)
+
+    # Кнопки прокси: по 2 в ряд
+    buttons = [
+        InlineKeyboardButton(
+            text=f"{proxy.ip_short} {get_country_flag(proxy.country)} ({proxy.days_left}д)",
+            callback_data=f"{_PROXY_SELECT_PREFIX}{proxy.row_index}",
         )
+        for proxy in page_proxies
+    ]
+    rows = [buttons[i:i + 2] for i in range(0, len(buttons), 2)]
 
-    if pagination_buttons:
-        proxy_rows.append(len(pagination_buttons))
+    # Пагинация
+    pagination_row = _proxy_pagination_row(country, page, total_pages)
+    if pagination_row:
+        rows.append(pagination_row)
 
     # Кнопка назад
-    builder.button(
+    rows.append([InlineKeyboardButton(
         text="« К странам",
-        callback_data=ProxyBackCallback(to="country"),
-    )
-    proxy_rows.append(1)
+        callback_data=_PROXY_BACK["country"],
+    )])
 
-    builder.adjust(*proxy_rows)
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
+@cache
 def get_proxy_back_keyboard(to: str = "menu") -> InlineKeyboardMarkup:
     """Клавиатура с кнопкой назад"""
     builder = InlineKeyboardBuilder()
@@ -193,6 +210,7 @@ def get_proxy_back_keyboard(to: str = "menu") -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@cache
 def get_proxy_type_keyboard() -> InlineKeyboardMarkup:
     """Клавиатура выбора типа прокси (HTTP/SOCKS5)"""
     builder = InlineKeyboardBuilder()
@@ -203,19 +221,26 @@ def get_proxy_type_keyboard() -> InlineKeyboardMarkup:
         )
     builder.button(
         text="« Назад",
-        callback_data=ProxyBackCallback(to="menu"),
+        callback_data=_PROXY_BACK["menu"],
     )
     builder.adjust(2, 1)
     return builder.as_markup()
 
 
-def get_proxy_resource_multi_keyboard(selected: List[str]) -> InlineKeyboardMarkup:
+def get_proxy_resource_multi_keyboard(selected: Collection[str]) -> InlineKeyboardMarkup:
     """Клавиатура множественного выбора ресурсов для прокси"""
+    return _build_proxy_resource_multi_keyboard(
+        selected if isinstance(selected, frozenset) else frozenset(selected)
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_proxy_resource_multi_keyboard(selected: FrozenSet[str]) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры выбора ресурсов для прокси (кэш по набору выбранных)"""
     builder = InlineKeyboardBuilder()
 
     # Все ресурсы кроме OTHER
-    main_resources = [r for r in ProxyResource if r != ProxyResource.OTHER]
-    for resource in main_resources:
+    for resource in _PROXY_MAIN_RESOURCES:
         check = "✅ " if resource.value in selected else ""
         builder.button(
             text=f"{check}{resource.button_text}",
@@ -238,32 +263,33 @@ def get_proxy_resource_multi_keyboard(selected: List[str]) -> InlineKeyboardMark
     else:
         builder.button(
             text="« Назад",
-            callback_data=ProxyBackCallback(to="type"),
+            callback_data=_PROXY_BACK["type"],
         )
 
-    # Динамический layout: основные ресурсы по 2, затем Другие, Подтвердить или Назад
-    rows = [2] * (len(main_resources) // 2)
-    if len(main_resources) % 2:
-        rows.append(1)
-    rows.append(1)  # Другие
-    rows.append(1)  # Подтвердить или Назад
-
-    builder.adjust(*rows)
+    # Layout: основные ресурсы по 2, затем Другие, Подтвердить или Назад
+    builder.adjust(*_PROXY_MAIN_ROWS, 1, 1)
     return builder.as_markup()
 
 
-def get_proxy_resource_multi_keyboard_get(selected: List[str]) -> InlineKeyboardMarkup:
+def get_proxy_resource_multi_keyboard_get(selected: Collection[str]) -> InlineKeyboardMarkup:
     """
     Клавиатура множественного выбора ресурсов при ПОЛУЧЕНИИ прокси.
 
     Аналогична get_proxy_resource_multi_keyboard, но с другой кнопкой "Назад"
     и другими callback-ами.
     """
+    return _build_proxy_resource_multi_keyboard_get(
+        selected if isinstance(selected, frozenset) else frozenset(selected)
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_proxy_resource_multi_keyboard_get(selected: FrozenSet[str]) -> InlineKeyboardMarkup:
+    """Сборка клавиатуры выбора ресурсов при получении прокси (кэш по набору выбранных)"""
     builder = InlineKeyboardBuilder()
 
     # Все ресурсы кроме OTHER
-    main_resources = [r for r in ProxyResource if r != ProxyResource.OTHER]
-    for resource in main_resources:
+    for resource in _PROXY_MAIN_RESOURCES:
         check = "✅ " if resource.value in selected else ""
         builder.button(
             text=f"{check}{resource.button_text}",
@@ -286,17 +312,11 @@ def get_proxy_resource_multi_keyboard_get(selected: List[str]) -> InlineKeyboard
     else:
         builder.button(
             text="« Назад",
-            callback_data=ProxyBackCallback(to="menu"),
+            callback_data=_PROXY_BACK["menu"],
         )
 
-    # Динамический layout
-    rows = [2] * (len(main_resources) // 2)
-    if len(main_resources) % 2:
-        rows.append(1)
-    rows.append(1)  # Другие
-    rows.append(1)  # Подтвердить или Назад
-
-    builder.adjust(*rows)
+    # Layout: основные ресурсы по 2, затем Другие, Подтвердить или Назад
+    builder.adjust(*_PROXY_MAIN_ROWS, 1, 1)
     return builder.as_markup()
 
 
@@ -320,64 +340,42 @@ def get_proxy_list_multi_keyboard(
     Returns:
         Клавиатура с флагами/галочками, пагинацией и кнопкой подтверждения
     """
-    builder = InlineKeyboardBuilder()
-
-    total_pages = (len(proxies) + PROXIES_PER_PAGE - 1) // PROXIES_PER_PAGE
-    start_idx = page * PROXIES_PER_PAGE
-    end_idx = min(start_idx + PROXIES_PER_PAGE, len(proxies))
-
-    page_proxies = proxies[start_idx:end_idx]
+    page_proxies, total_pages = _proxy_page(proxies, page)
     flag = get_country_flag(country)
 
-    # Кнопки прокси: флаг → галочка при выборе
-    for proxy in page_proxies:
-        is_selected = proxy.row_index in selected_rows
-        icon = "✅" if is_selected else flag
-        text = f"{icon} {proxy.ip_short} ({proxy.days_left}д)"
-        builder.button(
-            text=text,
-            callback_data=ProxyToggleCallback(
-                row_index=proxy.row_index,
-                country=country,
-                page=page
-            ),
+    # ProxyToggleCallback: country и page общие для страницы — упаковываем их один раз,
+    # для каждой кнопки подставляется только row_index
+    separator = ProxyToggleCallback.__separator__
+    if separator in country:
+        raise ValueError(f"Separator symbol {separator!r} can not be used in country {country!r}")
+    toggle_tail = f"{separator}{country}{separator}{page}"
+
+    # Кнопки прокси: флаг → галочка при выборе, по 2 в ряд (сетка 2x5)
+    buttons = [
+        InlineKeyboardButton(
+            text=f"{'✅' if proxy.row_index in selected_rows else flag} {proxy.ip_short} ({proxy.days_left}д)",
+            callback_data=f"{_PROXY_TOGGLE_PREFIX}{proxy.row_index}{toggle_tail}",
         )
-
-    # По 2 прокси в ряд (сетка 2x5)
-    proxy_rows = [2] * (len(page_proxies) // 2)
-    if len(page_proxies) % 2:
-        proxy_rows.append(1)
+        for proxy in page_proxies
+    ]
+    rows = [buttons[i:i + 2] for i in range(0, len(buttons), 2)]
 
     # Кнопка подтверждения (если есть выбранные - показываем общее количество)
     if total_selected > 0:
-        builder.button(
+        rows.append([InlineKeyboardButton(
             text=f"✅ Подтвердить ({total_selected})",
-            callback_data=ProxyConfirmMultiCallback(country=country),
-        )
-        proxy_rows.append(1)
+            callback_data=ProxyConfirmMultiCallback(country=country).pack(),
+        )])
 
     # Пагинация
-    pagination_buttons = []
-    if page > 0:
-        pagination_buttons.append(("« Пред", page - 1))
-    if page < total_pages - 1:
-        pagination_buttons.append(("След »", page + 1))
-
-    for text, pg in pagination_buttons:
-        builder.button(
-            text=text,
-            callback_data=ProxyPageCallback(page=pg, country=country),
-        )
-
-    if pagination_buttons:
-        proxy_rows.append(len(pagination_buttons))
+    pagination_row = _proxy_pagination_row(country, page, total_pages)
+    if pagination_row:
+        rows.append(pagination_row)
 
     # Кнопка назад к странам
-    builder.button(
+    rows.append([InlineKeyboardButton(
         text="« К странам",
-        callback_data=ProxyBackCallback(to="country"),
-    )
-    proxy_rows.append(1)
+        callback_data=_PROXY_BACK["country"],
+    )])
 
-    builder.adjust(*proxy_rows)
-    return builder.as_markup()
+    return InlineKeyboardMarkup(inline_keyboard=rows)
@@ -10,6 +10,7 @@ from aiogram.types import BotCommand
 from bot.config import settings
 from bot.handlers import start, admin, account_flow, feedback, statistic, proxy, numbers, email_flow, email_rental_flow
 from bot.middlewares.auth import WhitelistMiddleware
+from bot.middlewares.throttling import TelegramRateLimitMiddleware
 from bot.services.account_service import account_cache
 from bot.services.proxy_service import init_proxy_service, get_proxy_service
 from bot.services.sheets_service import agcm
@@ -24,10 +25,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Роутеры в порядке регистрации (порядок важен: первый подходящий хэндлер обрабатывает апдейт)
+ROUTERS = (
+    start.router,
+    admin.router,
+    account_flow.router,
+    feedback.router,
+    statistic.router,
+    proxy.router,
+    numbers.router,
+    email_flow.router,
+    email_rental_flow.router,
+)
 
-async def on_startup(bot: Bot):
-    """Действия при запуске бота"""
-    # Устанавливаем команды бота для меню Telegram
+
+async def _set_commands(bot: Bot) -> None:
+    """Установить команды бота для меню Telegram"""
     commands = [
         BotCommand(command="start", description="Начать работу / Главное меню"),
         BotCommand(command="statistic", description="Статистика по аккаунтам"),
@@ -35,36 +48,50 @@ async def on_startup(bot: Bot):
     await bot.set_my_commands(commands)
     logger.info("Bot commands set")
 
-    # Инициализируем менеджер pending сообщений для автоподтверждения
-    pending_messages.set_bot(bot)
-    await pending_messages.start_check_task()
-    logger.info("Pending messages manager started")
 
-    # Инициализируем сервис прокси и запускаем очистку резерваций
+async def _start_proxy_service() -> None:
+    """Инициализировать сервис прокси и запустить очистку резерваций"""
     proxy_service = init_proxy_service(agcm)
     await proxy_service.start_cleanup_task()
     logger.info("Proxy service initialized with cleanup task")
 
-    # Создаём листы для номеров если их нет
+
+async def _init_number_sheets() -> None:
+    """Создать листы для номеров если их нет"""
     await number_service.ensure_sheets_exist()
     logger.info("Number sheets initialized")
 
-    # Предзагрузка аккаунтов в кэш (удаляются из "Базы" сразу)
-    logger.info("Preloading accounts into cache...")
-    await account_cache.preload_all()
 
-    # Предзагрузка почт в кэш
-    logger.info("Preloading emails into cache...")
-    await email_service.preload_all()
+async def on_startup(bot: Bot):
+    """Действия при запуске бота"""
+    # Инициализируем менеджер pending сообщений для автоподтверждения
+    pending_messages.set_bot(bot)
+    await pending_messages.start_check_task()
+    logger.info("Pending messages manager started")
+
+    # Команды бота (Telegram), сервис прокси и листы номеров (Sheets) независимы —
+    # запросы идут параллельно
+    await asyncio.gather(
+        _set_commands(bot),
+        _start_proxy_service(),
+        _init_number_sheets(),
+    )
 
-    # Предзагрузка номеров в кэш
-    logger.info("Preloading numbers into cache...")
-    await number_cache.preload()
+    # Предзагрузка аккаунтов (удаляются из "Базы" сразу), почт и номеров в кэш.
+    # Кэши независимы друг от друга — грузим параллельно
+    logger.info("Preloading accounts, emails and numbers into cache...")
+    await asyncio.gather(
+        account_cache.preload_all(),
+        email_service.preload_all(),
+        number_cache.preload(),
+    )
 
     # Запуск фоновых задач (запись в Sheets, автоподтверждение, сохранение состояния)
-    await account_cache.start_background_tasks()
-    await email_service.start_background_tasks()
-    await number_cache.start_background_tasks()
+    await asyncio.gather(
+        account_cache.start_background_tasks(),
+        email_service.start_background_tasks(),
+        number_cache.start_background_tasks(),
+    )
 
 
 async def on_shutdown(bot: Bot):
@@ -78,10 +105,17 @@ async def on_shutdown(bot: Bot):
     except RuntimeError:
         pass  # Сервис не был инициализирован
 
-    # Корректное завершение кэшей (сохранение состояния, flush буферов)
-    await account_cache.shutdown()
-    await email_service.shutdown()
-    await number_cache.shutdown()
+    # Корректное завершение кэшей (сохранение состояния, flush буферов).
+    # Параллельно и независимо: ошибка одного кэша не мешает сохранить остальные
+    results = await asyncio.gather(
+        account_cache.shutdown(),
+        email_service.shutdown(),
+        number_cache.shutdown(),
+        return_exceptions=True,
+    )
+    for name, result in zip(("account", "email", "number"), results):
+        if isinstance(result, Exception):
+            logger.error(f"Error shutting down {name} cache: {result}", exc_info=result)
 
     await bot.session.close()
     logger.info("Bot stopped")
@@ -96,15 +130,7 @@ def create_dispatcher() -> Dispatcher:
     dp.callback_query.middleware(WhitelistMiddleware())
 
     # Регистрация роутеров
-    dp.include_router(start.router)
-    dp.include_router(admin.router)
-    dp.include_router(account_flow.router)
-    dp.include_router(feedback.router)
-    dp.include_router(statistic.router)
-    dp.include_router(proxy.router)
-    dp.include_router(numbers.router)
-    dp.include_router(email_flow.router)
-    dp.include_router(email_rental_flow.router)
+    dp.include_routers(*ROUTERS)
 
     return dp
 
@@ -115,6 +141,8 @@ async def main():
         token=settings.BOT_TOKEN,
         default=DefaultBotProperties(parse_mode=ParseMode.HTML)
     )
+    # Лимит исходящих сообщений и повтор после flood control
+    bot.session.middleware(TelegramRateLimitMiddleware())
     dp = create_dispatcher()
 
     # Регистрируем startup/shutdown
@@ -23,6 +23,12 @@ class WhitelistMiddleware(BaseMiddleware):
     ) -> Any:
         user_id = None
 
+        # Одобренные пользователи проходят сразу: whitelist хранится в памяти,
+        # поэтому проверка дешевле чтения FSM состояния ниже
+        if isinstance(event, (Message, CallbackQuery)) and event.from_user:
+            if whitelist_service.is_approved(event.from_user.id):
+                return await handler(event, data)
+
         # Проверяем FSM состояние - пропускаем пользователей в процессе регистрации
         state: FSMContext = data.get("state")
         if state:
@@ -53,9 +59,7 @@ class WhitelistMiddleware(BaseMiddleware):
 
         if user_id:
             try:
-                user = whitelist_service.get_user(user_id)
-
-                if not user or not user.is_approved:
+                if not whitelist_service.is_approved(user_id):
                     # Пользователь не авторизован
                     if isinstance(event, Message):
                         await event.answer(
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import time
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    TelegramMethod,
+    Response,
+    SendMessage,
+    EditMessageText,
+    EditMessageReplyMarkup,
+    SendDocument,
+    SendPhoto,
+)
+from aiogram.methods.base import TelegramType
+
+logger = logging.getLogger(__name__)
+
+# Исходящие сообщения, на которые действует лимит Telegram (~30 сообщений/сек на бота)
+THROTTLED_METHODS = (
+    SendMessage,
+    EditMessageText,
+    EditMessageReplyMarkup,
+    SendDocument,
+    SendPhoto,
+)
+
+
+class TelegramRateLimitMiddleware(BaseRequestMiddleware):
+    """
+    Middleware сессии бота для исходящих запросов к Telegram.
+
+    - Отправка/редактирование сообщений идёт не чаще messages_per_second
+      (с запасом от лимита 30/сек на бота)
+    - При TelegramRetryAfter ждём указанное время и повторяем запрос один раз
+    """
+
+    def __init__(self, messages_per_second: float = 25.0):
+        self._min_interval = 1.0 / messages_per_second
+        self._last_request_time = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _acquire(self) -> None:
+        """Дождаться слота для отправки сообщения"""
+        async with self._lock:
+            elapsed = time.monotonic() - self._last_request_time
+            if elapsed < self._min_interval:
+                await asyncio.sleep(self._min_interval - elapsed)
+            self._last_request_time = time.monotonic()
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        throttled = isinstance(method, THROTTLED_METHODS)
+        if throttled:
+            await self._acquire()
+
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as e:
+            logger.warning("Telegram flood control on %s, retry in %ss", type(method).__name__, e.retry_after)
+            await asyncio.sleep(e.retry_after)
+            if throttled:
+                await self._acquire()
+            return await make_request(bot, method)
@@ -1,4 +1,37 @@
 from enum import Enum
+from functools import lru_cache
+
+# Названия и эмодзи Resource/Gender (читаются на каждом шаге выдачи и статистики,
+# поэтому словари создаются один раз, а не при каждом обращении к свойству)
+_RESOURCE_NAMES = {
+    "vk": "ВКонтакте",
+    "mamba": "Мамба",
+    "ok": "Одноклассники",
+    "gmail": "Gmail",
+}
+
+_RESOURCE_EMOJIS = {
+    "vk": "🔵",
+    "mamba": "🔴",
+    "ok": "🟠",
+    "gmail": "📧",
+}
+
+_GENDER_NAMES = {
+    "male": "Мужской",
+    "female": "Женский",
+    "any": "Любые",
+    "gmail_domain": "gmail.com",
+    "none": "—",
+}
+
+_GENDER_EMOJIS = {
+    "male": "👨",
+    "female": "👩",
+    "any": "📧",
+    "gmail_domain": "📧",
+    "none": "",
+}
 
 
 class Resource(str, Enum):
@@ -9,23 +42,11 @@ class Resource(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "vk": "ВКонтакте",
-            "mamba": "Мамба",
-            "ok": "Одноклассники",
-            "gmail": "Gmail",
-        }
-        return names[self.value]
+        return _RESOURCE_NAMES[self.value]
 
     @property
     def emoji(self) -> str:
-        emojis = {
-            "vk": "🔵",
-            "mamba": "🔴",
-            "ok": "🟠",
-            "gmail": "📧",
-        }
-        return emojis[self.value]
+        return _RESOURCE_EMOJIS[self.value]
 
     @property
     def button_text(self) -> str:
@@ -41,25 +62,11 @@ class Gender(str, Enum):
 
     @property
     def display_name(self) -> str:
-        names = {
-            "male": "Мужской",
-            "female": "Женский",
-            "any": "Любые",
-            "gmail_domain": "gmail.com",
-            "none": "—",
-        }
-        return names[self.value]
+        return _GENDER_NAMES[self.value]
 
     @property
     def emoji(self) -> str:
-        emojis = {
-            "male": "👨",
-            "female": "👩",
-            "any": "📧",
-            "gmail_domain": "📧",
-            "none": "",
-        }
-        return emojis[self.value]
+        return _GENDER_EMOJIS[self.value]
 
     @property
     def button_text(self) -> str:
@@ -658,6 +665,7 @@ COUNTRY_NAMES = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_country_flag(country_code: str) -> str:
     """Получить флаг страны по коду (генерация из Unicode Regional Indicator Symbols)"""
     code = country_code.upper()
@@ -672,6 +680,7 @@ def get_country_flag(country_code: str) -> str:
         return "🌐"
 
 
+@lru_cache(maxsize=256)
 def get_country_name(country_code: str) -> str:
     """Получить название страны по коду"""
     return COUNTRY_NAMES.get(country_code.upper(), country_code.upper())
@@ -14,7 +14,7 @@ import asyncio
 import aiohttp
 from typing import List, Optional, Dict, Set, Tuple
 from datetime import datetime, date, timedelta
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
 import time
 
@@ -417,14 +417,15 @@ class ProxyService:
             return len(resources_lower & reserved_resources) == 0
 
     async def get_countries_with_counts(self, resources: List[str]) -> Dict[str, int]:
-        """Get dictionary of countries with count of available proxies for resources"""
-        proxies = await self.get_available_proxies(resources)
+        """
+        Get dictionary of countries with count of available proxies for resources.
 
-        counts = defaultdict(int)
-        for proxy in proxies:
-            counts[proxy.country] += 1
+        Ordered by count, most proxies first (ties keep first-seen order).
+        """
+        proxies = await self.get_available_proxies(resources)
 
-        return dict(counts)
+        counts = Counter(proxy.country for proxy in proxies)
+        return dict(counts.most_common())
 
     async def get_proxies_by_country(
         self,
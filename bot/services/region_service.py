@@ -2,21 +2,38 @@
 import json
 import logging
 from pathlib import Path
-from typing import List, Set
+from typing import FrozenSet, List, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Путь к файлу с регионами
 REGIONS_FILE = Path(__file__).parent.parent.parent / "data" / "regions.json"
 
+# Кнопок регионов в одном ряду клавиатуры
+REGIONS_PER_ROW = 3
+
 
 class RegionService:
     """Сервис для управления регионами"""
 
     def __init__(self):
         self._regions: Set[str] = set()
+        self._regions_tuple: Tuple[str, ...] = ()  # Отсортированные регионы
+        self._regions_frozen: FrozenSet[str] = frozenset()  # Снимок для проверок вхождения
+        self._keyboard_rows: Tuple[int, ...] = ()  # Раскладка кнопок регионов (по 3 в ряд)
+        self._version = 0  # Увеличивается при каждом изменении списка
         self._load_regions()
 
+    def _on_regions_changed(self) -> None:
+        """Пересчитать отсортированный список и версию после изменения"""
+        self._regions_tuple = tuple(sorted(
+            self._regions,
+            key=lambda x: int(x) if x.isdigit() else float('inf')
+        ))
+        self._regions_frozen = frozenset(self._regions)
+        self._keyboard_rows = (REGIONS_PER_ROW,) * -(-len(self._regions) // REGIONS_PER_ROW)
+        self._version += 1
+
     def _load_regions(self) -> None:
         """Загрузить регионы из файла"""
         try:
@@ -24,15 +41,18 @@ class RegionService:
                 with open(REGIONS_FILE, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     self._regions = set(data.get("regions", []))
+                    self._on_regions_changed()
                     logger.info(f"Loaded {len(self._regions)} regions from file")
             else:
                 # Создаём файл с начальными регионами
                 self._regions = set()
+                self._on_regions_changed()
                 self._save_regions()
                 logger.info("Created new regions file")
         except Exception as e:
             logger.error(f"Error loading regions: {e}")
             self._regions = set()
+            self._on_regions_changed()
 
     def _save_regions(self) -> None:
         """Сохранить регионы в файл"""
@@ -40,24 +60,33 @@ class RegionService:
             # Создаём директорию если не существует
             REGIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-            # Сортируем регионы по числовому значению
-            sorted_regions = sorted(
-                self._regions,
-                key=lambda x: int(x) if x.isdigit() else float('inf')
-            )
-
+            # Регионы отсортированы по числовому значению
             with open(REGIONS_FILE, "w", encoding="utf-8") as f:
-                json.dump({"regions": sorted_regions}, f, ensure_ascii=False, indent=2)
+                json.dump({"regions": list(self._regions_tuple)}, f, ensure_ascii=False, indent=2)
             logger.info(f"Saved {len(self._regions)} regions to file")
         except Exception as e:
             logger.error(f"Error saving regions: {e}")
 
+    @property
+    def version(self) -> int:
+        """Версия списка регионов (для инвалидации кэшей клавиатур)"""
+        return self._version
+
     def get_regions(self) -> List[str]:
         """Получить отсортированный список регионов"""
-        return sorted(
-            self._regions,
-            key=lambda x: int(x) if x.isdigit() else float('inf')
-        )
+        return list(self._regions_tuple)
+
+    def get_regions_tuple(self) -> Tuple[str, ...]:
+        """Отсортированные регионы без копирования (неизменяемый кортеж)"""
+        return self._regions_tuple
+
+    def get_regions_frozenset(self) -> FrozenSet[str]:
+        """Неизменяемый снимок регионов (пересоздаётся при изменении списка)"""
+        return self._regions_frozen
+
+    def get_keyboard_rows(self) -> Tuple[int, ...]:
+        """Ряды для builder.adjust() под кнопки регионов (последний ряд может быть неполным)"""
+        return self._keyboard_rows
 
     def region_exists(self, region: str) -> bool:
         """Проверить существование региона"""
@@ -70,6 +99,7 @@ class RegionService:
             return False
 
         self._regions.add(region)
+        self._on_regions_changed()
         self._save_regions()
         logger.info(f"Added new region: {region}")
         return True
@@ -81,6 +111,7 @@ class RegionService:
             return False
 
         self._regions.remove(region)
+        self._on_regions_changed()
         self._save_regions()
         logger.info(f"Removed region: {region}")
         return True
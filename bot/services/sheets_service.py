@@ -3,7 +3,7 @@ import json
 import base64
 import logging
 import time
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Sequence, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
@@ -130,6 +130,91 @@ class NumberStatistics:
     no_status: int = 0
 
 
+# Статус (в нижнем регистре) -> индекс счётчика [total, good, block, defect, no_status]
+_ACCOUNT_STATUS_INDEX = {
+    "good": 1,
+    "хороший": 1,
+    "block": 2,
+    "блок": 2,
+    "defect": 3,
+    "дефектный": 3,
+}
+
+
+def _count_statistics(
+    all_values: List[List[str]],
+    region_col: int,
+    status_col: int,
+    start_date: datetime,
+    regions: Sequence[str],
+) -> Tuple[List[int], Dict[str, List[int]]]:
+    """
+    Один проход по строкам листа выдачи: счётчики за период по всем строкам
+    и по каждому региону из списка.
+
+    Счётчики — списки [total, good, block, defect, no_status], каждая
+    уникальная дата парсится один раз (в листе много строк с одной датой).
+    Дата — в колонке 0, первая строка — заголовок.
+    """
+    total = [0, 0, 0, 0, 0]
+    counts: Dict[str, List[int]] = {region: [0, 0, 0, 0, 0] for region in regions}
+    in_period_by_date: Dict[str, bool] = {}
+    status_index = _ACCOUNT_STATUS_INDEX
+
+    for row in all_values[1:]:
+        if not row or not row[0]:
+            continue
+
+        date_str = row[0]
+        in_period = in_period_by_date.get(date_str)
+        if in_period is None:
+            in_period = parse_date(date_str) >= start_date
+            in_period_by_date[date_str] = in_period
+        if not in_period:
+            continue
+
+        row_len = len(row)
+        status = row[status_col].lower().strip() if 0 <= status_col < row_len else ""
+        index = status_index.get(status, 4)
+        total[0] += 1
+        total[index] += 1
+
+        row_region = row[region_col] if 0 <= region_col < row_len else ""
+        bucket = counts.get(row_region)
+        if bucket is not None:
+            bucket[0] += 1
+            bucket[index] += 1
+
+    return total, counts
+
+
+def aggregate_statistics_by_region(
+    all_values: List[List[str]],
+    region_col: int,
+    status_col: int,
+    start_date: datetime,
+    regions: Sequence[str],
+) -> Dict[str, AccountStatistics]:
+    """Подсчёт статистики по регионам за один проход по строкам листа выдачи"""
+    _, counts = _count_statistics(all_values, region_col, status_col, start_date, regions)
+    return {region: AccountStatistics(*bucket) for region, bucket in counts.items()}
+
+
+def aggregate_statistics_with_regions(
+    all_values: List[List[str]],
+    region_col: int,
+    status_col: int,
+    start_date: datetime,
+    regions: Sequence[str],
+) -> Tuple[AccountStatistics, Dict[str, AccountStatistics]]:
+    """Общая статистика за период и статистика по регионам за один проход"""
+    total, counts = _count_statistics(all_values, region_col, status_col, start_date, regions)
+    return (
+        AccountStatistics(*total),
+        {region: AccountStatistics(*bucket) for region, bucket in counts.items()},
+    )
+
+
 def get_creds():
     """Создание credentials для Google Sheets API"""
     creds_data = settings.GOOGLE_CREDENTIALS_JSON
@@ -595,33 +680,45 @@ class SheetsService:
 
     # === Статистика ===
 
+    async def _read_issued_accounts(
+        self,
+        resource: Resource,
+        gender: Gender,
+        period: str,  # day, week, month
+    ) -> Tuple[List[List[str]], datetime]:
+        """Прочитать лист выданных аккаунтов и определить дату начала периода"""
+        agc = await self._get_client()
+        ss = await agc.open_by_key(settings.SPREADSHEET_ISSUED)
+
+        sheet_name = self._get_sheet_name(resource, gender)
+        ws = await ss.worksheet(sheet_name)
+
+        all_values = await ws.get_all_values()
+
+        # Определяем дату начала периода
+        now = datetime.now()
+        if period == "day":
+            start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        elif period == "week":
+            start_date = now - timedelta(days=7)
+        elif period == "month":
+            start_date = now - timedelta(days=30)
+        else:
+            start_date = now - timedelta(days=1)
+
+        return all_values, start_date
+
     async def get_statistics(
         self,
         resource: Resource,
         gender: Gender,
         region: Optional[str],  # None означает все регионы
         period: str,  # day, week, month
+        raise_errors: bool = False,  # True — пробросить ошибку вместо пустой статистики
     ) -> AccountStatistics:
         """Получить статистику выданных аккаунтов за период"""
         try:
-            agc = await self._get_client()
-            ss = await agc.open_by_key(settings.SPREADSHEET_ISSUED)
-
-            sheet_name = self._get_sheet_name(resource, gender)
-            ws = await ss.worksheet(sheet_name)
-
-            all_values = await ws.get_all_values()
-
-            # Определяем дату начала периода
-            now = datetime.now()
-            if period == "day":
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif period == "week":
-                start_date = now - timedelta(days=7)
-            elif period == "month":
-                start_date = now - timedelta(days=30)
-            else:
-                start_date = now - timedelta(days=1)
+            all_values, start_date = await self._read_issued_accounts(resource, gender, period)
 
             stats = AccountStatistics()
 
@@ -683,96 +780,75 @@ class SheetsService:
 
         except Exception as e:
             logger.error(f"Error getting statistics: {e}")
+            if raise_errors:
+                raise
             return AccountStatistics()
 
     async def get_statistics_by_regions(
         self,
         resource: Resource,
         gender: Gender,
-        regions: List[str],  # Список регионов для подсчёта
+        regions: Sequence[str],  # Список регионов для подсчёта
         period: str,  # day, week, month
+        raise_errors: bool = False,  # True — пробросить ошибку вместо пустой статистики
     ) -> Dict[str, AccountStatistics]:
         """Получить статистику по каждому региону отдельно"""
         try:
-            agc = await self._get_client()
-            ss = await agc.open_by_key(settings.SPREADSHEET_ISSUED)
-
-            sheet_name = self._get_sheet_name(resource, gender)
-            ws = await ss.worksheet(sheet_name)
-
-            all_values = await ws.get_all_values()
-
-            # Определяем дату начала периода
-            now = datetime.now()
-            if period == "day":
-                start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif period == "week":
-                start_date = now - timedelta(days=7)
-            elif period == "month":
-                start_date = now - timedelta(days=30)
-            else:
-                start_date = now - timedelta(days=1)
-
-            # Инициализируем статистику для каждого региона
-            stats_by_region: Dict[str, AccountStatistics] = {
-                region: AccountStatistics() for region in regions
-            }
+            all_values, start_date = await self._read_issued_accounts(resource, gender, period)
 
             if len(all_values) < 2:
-                return stats_by_region
+                return {region: AccountStatistics() for region in regions}
 
+            # Формат: date (0) | ... | region (-3) | employee (-2) | status (-1)
             header = all_values[0]
-            date_col = 0
             region_col = len(header) - 3 if len(header) >= 3 else -1
             status_col = len(header) - 1 if len(header) >= 1 else -1
 
-            for row in all_values[1:]:
-                if not row or not row[0]:
-                    continue
-
-                # Парсим дату (поддержка dd.mm.yy и YYYY-MM-DD)
-                try:
-                    row_date = parse_date(row[date_col])
-                except (ValueError, IndexError):
-                    continue
-
-                # Проверяем период
-                if row_date < start_date:
-                    continue
-
-                # Получаем регион строки
-                try:
-                    row_region = row[region_col] if region_col >= 0 and len(row) > region_col else ""
-                except IndexError:
-                    continue
+            # Разбор всех строк листа — в потоке, чтобы не блокировать event loop
+            return await asyncio.to_thread(
+                aggregate_statistics_by_region,
+                all_values, region_col, status_col, start_date, regions,
+            )
 
-                # Если регион не в списке - пропускаем
-                if row_region not in stats_by_region:
-                    continue
+        except Exception as e:
+            logger.error(f"Error getting statistics by regions: {e}")
+            if raise_errors:
+                raise
+            return {region: AccountStatistics() for region in regions}
 
-                # Подсчитываем статистику для этого региона
-                stats = stats_by_region[row_region]
-                stats.total += 1
+    async def get_statistics_with_regions(
+        self,
+        resource: Resource,
+        gender: Gender,
+        regions: Sequence[str],  # Список регионов для подсчёта
+        period: str,  # day, week, month
+        raise_errors: bool = False,  # True — пробросить ошибку вместо пустой статистики
+    ) -> Tuple[AccountStatistics, Dict[str, AccountStatistics]]:
+        """
+        Статистика по всем регионам и по каждому региону отдельно
+        за одно чтение листа (для сводки "все регионы" с кнопкой "Детальнее")
+        """
+        try:
+            all_values, start_date = await self._read_issued_accounts(resource, gender, period)
 
-                try:
-                    status = row[status_col].lower().strip() if status_col >= 0 and len(row) > status_col else ""
-                except IndexError:
-                    status = ""
+            if len(all_values) < 2:
+                return AccountStatistics(), {region: AccountStatistics() for region in regions}
 
-                if status == "good" or status == "хороший":
-                    stats.good += 1
-                elif status == "block" or status == "блок":
-                    stats.block += 1
-                elif status == "defect" or status == "дефектный":
-                    stats.defect += 1
-                else:
-                    stats.no_status += 1
+            # Формат: date (0) | ... | region (-3) | employee (-2) | status (-1)
+            header = all_values[0]
+            region_col = len(header) - 3 if len(header) >= 3 else -1
+            status_col = len(header) - 1 if len(header) >= 1 else -1
 
-            return stats_by_region
+            return await asyncio.to_thread(
+                aggregate_statistics_with_regions,
+                all_values, region_col, status_col, start_date, regions,
+            )
 
         except Exception as e:
-            logger.error(f"Error getting statistics by regions: {e}")
-            return {region: AccountStatistics() for region in regions}
+            logger.error(f"Error getting statistics with regions: {e}")
+            if raise_errors:
+                raise
+            return AccountStatistics(), {region: AccountStatistics() for region in regions}
 
     # === Статистика почт ===
 
@@ -793,6 +869,7 @@ class SheetsService:
         email_type: Optional[Gender],  # None для Rambler
         region: Optional[str],  # None для всех регионов
         period: str,
+        raise_errors: bool = False,  # True — пробросить ошибку вместо пустой статистики
     ) -> AccountStatistics:
         """Получить статистику выданных почт за период"""
         try:
@@ -867,13 +944,15 @@ class SheetsService:
 
         except Exception as e:
             logger.error(f"Error getting email statistics: {e}")
+            if raise_errors:
+                raise
             return AccountStatistics()
 
     async def get_email_statistics_by_regions(
         self,
         email_resource: EmailResource,
         email_type: Optional[Gender],
-        regions: List[str],
+        regions: Sequence[str],
         period: str,
     ) -> Dict[str, AccountStatistics]:
         """Получить статистику почт по каждому региону отдельно"""
@@ -896,55 +975,14 @@ class SheetsService:
             else:
                 start_date = now - timedelta(days=1)
 
-            stats_by_region: Dict[str, AccountStatistics] = {
-                region: AccountStatistics() for region in regions
-            }
-
             if len(all_values) < 2:
-                return stats_by_region
-
-            date_col = 0
-            region_col = 4
-            status_col = 6
+                return {region: AccountStatistics() for region in regions}
 
-            for row in all_values[1:]:
-                if not row or not row[0]:
-                    continue
-
-                try:
-                    row_date = parse_date(row[date_col])
-                except (ValueError, IndexError):
-                    continue
-
-                if row_date < start_date:
-                    continue
-
-                try:
-                    row_region = row[region_col] if len(row) > region_col else ""
-                except IndexError:
-                    continue
-
-                if row_region not in stats_by_region:
-                    continue
-
-                stats = stats_by_region[row_region]
-                stats.total += 1
-
-                try:
-                    status = row[status_col].lower().strip() if len(row) > status_col else ""
-                except IndexError:
-                    status = ""
-
-                if status == "good" or status == "хороший":
-                    stats.good += 1
-                elif status == "block" or status == "блок":
-                    stats.block += 1
-                elif status == "defect" or status == "дефектный":
-                    stats.defect += 1
-                else:
-                    stats.no_status += 1
-
-            return stats_by_region
+            # Формат почт: Дата выдачи | Логин | Пароль | Доп инфа | Регион | Employee | Статус
+            return await asyncio.to_thread(
+                aggregate_statistics_by_region,
+                all_values, 4, 6, start_date, regions,
+            )
 
         except Exception as e:
             logger.error(f"Error getting email statistics by regions: {e}")
@@ -956,6 +994,7 @@ class SheetsService:
         self,
         region: Optional[str],  # None для всех регионов
         period: str,
+        raise_errors: bool = False,  # True — пробросить ошибку вместо пустой статистики
     ) -> NumberStatistics:
         """
         Получить статистику выданных номеров за период.
@@ -1053,11 +1092,13 @@ class SheetsService:
 
         except Exception as e:
             logger.error(f"Error getting number statistics: {e}")
+            if raise_errors:
+                raise
             return NumberStatistics()
 
     async def get_number_statistics_by_regions(
         self,
-        regions: List[str],
+        regions: Sequence[str],
         period: str,
     ) -> Dict[str, NumberStatistics]:
         """Получить статистику номеров по каждому региону отдельно"""
@@ -0,0 +1,91 @@
+"""Кэш результатов статистики (TTL + LRU)"""
+import copy
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Данные в таблицах выдачи меняются с человеческой скоростью (и пишутся
+# через буфер), поэтому статистика минутной давности приемлема
+STATS_CACHE_TTL = 60.0
+STATS_CACHE_MAX_SIZE = 256
+
+# TTL по периоду статистики: дневная меняется заметнее, недельная/месячная — медленно
+STATS_TTL_BY_PERIOD = {
+    "day": 300.0,
+    "week": 1800.0,
+    "month": 1800.0,
+}
+
+
+def ttl_for_period(period: str) -> float:
+    """TTL записи кэша для периода статистики"""
+    return STATS_TTL_BY_PERIOD.get(period, STATS_CACHE_TTL)
+
+
+class StatsCache:
+    """
+    In-memory кэш результатов статистики.
+
+    - Запись живёт STATS_CACHE_TTL секунд или TTL, переданный в set() (time.monotonic)
+    - get() отдаёт поверхностную копию, чтобы вызывающий код не менял общий объект
+    - При переполнении вытесняется давно не использованная запись (LRU)
+    """
+
+    def __init__(self, ttl: float = STATS_CACHE_TTL, max_size: int = STATS_CACHE_MAX_SIZE):
+        self._ttl = ttl
+        self._max_size = max_size
+        # key -> (expires_at, value)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        # Статистика
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Получить значение или None, если его нет или оно устарело"""
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            self._misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self._hits += 1
+        return copy.copy(value)
+
+    def contains(self, key: Hashable) -> bool:
+        """Есть ли актуальное значение (без учёта в hits/misses и порядке LRU)"""
+        entry = self._data.get(key)
+        return entry is not None and time.monotonic() < entry[0]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Сохранить значение (ttl=None — TTL кэша по умолчанию)"""
+        self._data[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Сбросить весь кэш (например, после изменения данных в таблицах)"""
+        self._data.clear()
+        logger.info("Statistics cache invalidated")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Получить статистику кэша"""
+        return {
+            "size": len(self._data),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+# Глобальный экземпляр
+stats_cache = StatsCache()
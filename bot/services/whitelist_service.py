@@ -62,6 +62,11 @@ class WhitelistService:
             )
         return None
 
+    def is_approved(self, telegram_id: int) -> bool:
+        """Одобрен ли пользователь (без создания User — проверяется на каждом апдейте)"""
+        user_data = self._users.get(telegram_id)
+        return bool(user_data and user_data.get("is_approved", False))
+
     def add_user(self, user: User) -> None:
         """Добавить пользователя в whitelist"""
         self._users[user.telegram_id] = {
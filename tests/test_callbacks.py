@@ -0,0 +1,50 @@
+"""
+Tests for callback data definitions.
+
+Run with: pytest tests/test_callbacks.py -v
+"""
+
+import pytest
+from aiogram.filters.callback_data import CallbackData
+
+from bot.keyboards import callbacks
+
+
+def _callback_classes():
+    return [
+        obj for obj in vars(callbacks).values()
+        if isinstance(obj, type) and issubclass(obj, CallbackData) and obj is not CallbackData
+    ]
+
+
+class TestCallbackPrefixes:
+    """Tests for CallbackData prefixes"""
+
+    def test_prefixes_are_unique(self):
+        """Test no two callback classes share a prefix (filters would match both)"""
+        prefixes = [cls.__prefix__ for cls in _callback_classes()]
+
+        duplicates = {p for p in prefixes if prefixes.count(p) > 1}
+        assert not duplicates
+
+
+class TestPackRegion:
+    """Tests for pack_region fast path"""
+
+    def test_matches_callback_pack(self):
+        """Test pack_region produces the same string as CallbackData.pack()"""
+        for cls in (
+            callbacks.RegionCallback,
+            callbacks.StatRegionCallback,
+            callbacks.EmailRegionCallback,
+            callbacks.NumberRegionCallback,
+        ):
+            packed = callbacks.pack_region(cls, "77")
+
+            assert packed == cls(region="77").pack()
+            assert cls.unpack(packed).region == "77"
+
+    def test_rejects_separator_in_region(self):
+        """Test region containing the separator is rejected like in pack()"""
+        with pytest.raises(ValueError):
+            callbacks.pack_region(callbacks.RegionCallback, "7:7")
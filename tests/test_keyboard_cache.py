@@ -0,0 +1,40 @@
+"""
+Tests for cached keyboard factories.
+
+Cached keyboards are shared objects: aiogram's InlineKeyboardMarkup is mutable,
+so every caller gets the same instance and must not modify it.
+
+Run with: pytest tests/test_keyboard_cache.py -v
+"""
+
+import pytest
+
+from bot.keyboards import (
+    email_keyboards,
+    email_rental_keyboards,
+    inline,
+    number_keyboards,
+    proxy_keyboards,
+)
+from bot.models.enums import EmailResource, Resource
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        inline.get_resource_keyboard,
+        inline.get_region_keyboard,
+        inline.get_stat_resource_keyboard,
+        inline.get_stat_region_keyboard,
+        inline.get_stat_back_to_menu_keyboard,
+        lambda: inline.get_stat_gender_keyboard(Resource.MAMBA),
+        email_keyboards.get_email_menu_keyboard,
+        lambda: email_keyboards.get_email_region_keyboard(EmailResource.GMAIL),
+        email_rental_keyboards.get_email_rental_error_keyboard,
+        number_keyboards.get_number_region_keyboard,
+        proxy_keyboards.get_proxy_menu_keyboard,
+    ],
+)
+def test_cached_keyboard_is_shared(factory):
+    """Test repeated calls return the identical markup object"""
+    assert factory() is factory()
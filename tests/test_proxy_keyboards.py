@@ -0,0 +1,67 @@
+"""
+Tests for proxy list keyboards.
+
+Run with: pytest tests/test_proxy_keyboards.py -v
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from bot.keyboards.callbacks import ProxyPageCallback, ProxySelectCallback, ProxyToggleCallback
+from bot.keyboards.proxy_keyboards import (
+    get_proxy_list_keyboard,
+    get_proxy_list_multi_keyboard,
+)
+from bot.models.proxy import Proxy
+
+
+def _proxies(count):
+    today = date.today()
+    return [
+        Proxy(
+            proxy=f"10.0.0.{i}:8080",
+            country="RU",
+            added_date=today,
+            expires_date=today + timedelta(days=i),
+            row_index=i + 2,
+        )
+        for i in range(count)
+    ]
+
+
+class TestProxyListCallbackData:
+    """Tests for hand-packed callback data in proxy list keyboards"""
+
+    def test_select_matches_callback_pack(self):
+        """Test select buttons carry the same data as ProxySelectCallback.pack()"""
+        markup = get_proxy_list_keyboard(_proxies(3), "RU")
+
+        assert markup.inline_keyboard[0][0].callback_data == ProxySelectCallback(row_index=2).pack()
+        assert markup.inline_keyboard[1][0].callback_data == ProxySelectCallback(row_index=4).pack()
+
+    def test_toggle_matches_callback_pack(self):
+        """Test toggle buttons carry the same data as ProxyToggleCallback.pack()"""
+        markup = get_proxy_list_multi_keyboard(_proxies(12), "RU", {12}, total_selected=1, page=1)
+
+        data = [button.callback_data for button in markup.inline_keyboard[0]]
+        assert data == [
+            ProxyToggleCallback(row_index=12, country="RU", page=1).pack(),
+            ProxyToggleCallback(row_index=13, country="RU", page=1).pack(),
+        ]
+        assert ProxyToggleCallback.unpack(data[0]) == ProxyToggleCallback(row_index=12, country="RU", page=1)
+
+    def test_pagination_matches_callback_pack(self):
+        """Test prev/next buttons carry the same data as ProxyPageCallback.pack()"""
+        markup = get_proxy_list_keyboard(_proxies(25), "RU", page=1)
+
+        data = [button.callback_data for button in markup.inline_keyboard[-2]]
+        assert data == [
+            ProxyPageCallback(page=0, country="RU").pack(),
+            ProxyPageCallback(page=2, country="RU").pack(),
+        ]
+
+    def test_toggle_rejects_separator_in_country(self):
+        """Test country containing the separator is rejected like in pack()"""
+        with pytest.raises(ValueError):
+            get_proxy_list_multi_keyboard(_proxies(1), "R:U", set())
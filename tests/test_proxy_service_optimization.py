@@ -242,6 +242,28 @@ class TestProxyServiceOptimizations:
         assert available[1].days_left == 10
         assert available[2].days_left == 5
 
+    @pytest.mark.asyncio
+    async def test_countries_ordered_by_count_descending(self, service):
+        """Test that countries come ordered by proxy count (more proxies first)"""
+        mock_ws = AsyncMock()
+        service._get_worksheet = AsyncMock(return_value=mock_ws)
+
+        expires = (date.today() + timedelta(days=10)).strftime("%d.%m.%y")
+
+        mock_ws.get_all_values = AsyncMock(return_value=[
+            ["proxy", "country", "added_date", "expires_date", "used_for", "proxy_type"],
+            ["1.1.1.1:8080", "US", "01.01.24", expires, "", "http"],
+            ["2.2.2.2:8080", "DE", "01.01.24", expires, "", "http"],
+            ["3.3.3.3:8080", "DE", "01.01.24", expires, "", "http"],
+            ["4.4.4.4:8080", "FR", "01.01.24", expires, "", "http"],
+            ["5.5.5.5:8080", "DE", "01.01.24", expires, "", "http"],
+            ["6.6.6.6:8080", "FR", "01.01.24", expires, "", "http"],
+        ])
+
+        countries = await service.get_countries_with_counts(["beboo"])
+
+        assert list(countries.items()) == [("DE", 3), ("FR", 2), ("US", 1)]
+
     @pytest.mark.asyncio
     async def test_cancel_all_reservations(self, service):
         """Test canceling all user reservations"""
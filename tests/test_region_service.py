@@ -0,0 +1,53 @@
+"""
+Tests for the region service.
+
+Run with: pytest tests/test_region_service.py -v
+"""
+
+import json
+
+import pytest
+
+from bot.services import region_service as region_module
+from bot.services.region_service import RegionService
+
+
+@pytest.fixture
+def regions_file(tmp_path, monkeypatch):
+    path = tmp_path / "regions.json"
+    monkeypatch.setattr(region_module, "REGIONS_FILE", path)
+    return path
+
+
+class TestReload:
+    """Tests for RegionService.reload"""
+
+    def test_reload_picks_up_file_changes(self, regions_file):
+        """Test reload refreshes the sorted tuple, snapshot and version"""
+        regions_file.write_text(json.dumps({"regions": ["77", "50"]}), encoding="utf-8")
+        service = RegionService()
+        version = service.version
+
+        regions_file.write_text(json.dumps({"regions": ["77", "50", "23"]}), encoding="utf-8")
+        service.reload()
+
+        assert service.get_regions_tuple() == ("23", "50", "77")
+        assert service.get_regions_frozenset() == frozenset({"23", "50", "77"})
+        assert service.version > version
+
+    def test_reload_with_missing_file(self, regions_file):
+        """Test reload after the file is deleted clears every view and writes an empty file"""
+        regions_file.write_text(json.dumps({"regions": ["77", "50"]}), encoding="utf-8")
+        service = RegionService()
+        version = service.version
+
+        regions_file.unlink()
+        service.reload()
+
+        assert service.get_regions() == []
+        assert service.get_regions_tuple() == ()
+        assert service.get_regions_frozenset() == frozenset()
+        assert service.get_keyboard_rows() == ()
+        assert not service.region_exists("77")
+        assert service.version > version
+        assert json.loads(regions_file.read_text(encoding="utf-8")) == {"regions": []}
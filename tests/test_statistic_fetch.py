@@ -0,0 +1,126 @@
+"""
+Tests for cached statistics fetching in the statistic handlers.
+
+Run with: pytest tests/test_statistic_fetch.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from bot.handlers import statistic
+from bot.models.enums import Gender, Resource
+from bot.services.sheets_service import AccountStatistics
+from bot.services.stats_cache import stats_cache
+
+
+class _Fetch:
+    """Fake statistics fetch: raises while `fail` is set, records calls"""
+
+    def __init__(self, result=None, fail=False):
+        self.result = result
+        self.fail = fail
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.fail:
+            raise RuntimeError("Sheets unavailable")
+        return self.result
+
+
+class TestCachedFetch:
+    """Tests for _cached_fetch"""
+
+    def setup_method(self):
+        stats_cache.invalidate()
+        statistic._SHEETS_LATENCY.clear()
+
+    def teardown_method(self):
+        stats_cache.invalidate()
+        statistic._SHEETS_LATENCY.clear()
+
+    @pytest.mark.asyncio
+    async def test_success_is_cached(self):
+        """Test successful result is cached and fetch gets raise_errors=True"""
+        fetch = _Fetch(result={"total": 1})
+
+        assert await statistic._cached_fetch("key", fetch, period="day") == {"total": 1}
+        assert await statistic._cached_fetch("key", fetch, period="day") == {"total": 1}
+
+        assert fetch.calls == [{"raise_errors": True, "period": "day"}]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_cached(self):
+        """Test a failed fetch propagates and the next call fetches again"""
+        fetch = _Fetch(result={"total": 1}, fail=True)
+
+        with pytest.raises(RuntimeError):
+            await statistic._cached_fetch("key", fetch, period="day")
+        assert not stats_cache.contains("key")
+
+        fetch.fail = False
+        assert await statistic._cached_fetch("key", fetch, period="day") == {"total": 1}
+        assert len(fetch.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_record_latency_once(self):
+        """Test joiners of an in-flight fetch do not record their wait as latency"""
+        release = asyncio.Event()
+
+        async def fetch(**kwargs):
+            await release.wait()
+            return {"total": 1}
+
+        calls = [asyncio.ensure_future(statistic._cached_fetch("key", fetch, period="day")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*calls) == [{"total": 1}] * 3
+        assert len(statistic._SHEETS_LATENCY) == 1
+
+
+class TestAllRegionsOverview:
+    """Tests for _fetch_all_regions_overview caching"""
+
+    def setup_method(self):
+        stats_cache.invalidate()
+
+    def teardown_method(self):
+        stats_cache.invalidate()
+
+    @pytest.mark.asyncio
+    async def test_failure_caches_neither_entry(self, monkeypatch):
+        """Test a failed sheet read caches neither the overview nor the breakdown"""
+        fetch = _Fetch(fail=True)
+        monkeypatch.setattr(statistic, "_get_statistics_with_regions", fetch)
+        overview_key = ("accounts", Resource.VK, Gender.NONE, "all", ("77",), "day")
+        breakdown_key = ("accounts_by_regions", Resource.VK, Gender.NONE, ("77",), "day")
+
+        with pytest.raises(RuntimeError):
+            await statistic._cached_fetch(
+                overview_key,
+                statistic._fetch_all_regions_overview,
+                resource=Resource.VK, gender=Gender.NONE, regions=("77",), period="day",
+            )
+
+        assert fetch.calls[0]["raise_errors"] is True
+        assert not stats_cache.contains(overview_key)
+        assert not stats_cache.contains(breakdown_key)
+
+    @pytest.mark.asyncio
+    async def test_success_caches_both_entries(self, monkeypatch):
+        """Test a successful read caches the overview and the breakdown"""
+        total, by_region = AccountStatistics(total=1), {"77": AccountStatistics(total=1)}
+        monkeypatch.setattr(statistic, "_get_statistics_with_regions", _Fetch(result=(total, by_region)))
+        overview_key = ("accounts", Resource.VK, Gender.NONE, "all", ("77",), "day")
+        breakdown_key = ("accounts_by_regions", Resource.VK, Gender.NONE, ("77",), "day")
+
+        result = await statistic._cached_fetch(
+            overview_key,
+            statistic._fetch_all_regions_overview,
+            resource=Resource.VK, gender=Gender.NONE, regions=("77",), period="day",
+        )
+
+        assert result == total
+        assert stats_cache.get(breakdown_key) == by_region
@@ -0,0 +1,86 @@
+"""
+Tests for per-region statistics aggregation.
+
+Run with: pytest tests/test_statistics_aggregation.py -v
+"""
+
+from datetime import datetime, timedelta
+
+from bot.services.sheets_service import (
+    AccountStatistics,
+    aggregate_statistics_by_region,
+    aggregate_statistics_with_regions,
+)
+
+
+def _rows(*rows):
+    """Sheet values with header: date | login | region | employee | status"""
+    return [["date", "login", "region", "employee", "status"], *rows]
+
+
+class TestAggregateStatisticsByRegion:
+    """Tests for aggregate_statistics_by_region"""
+
+    def setup_method(self):
+        self.today = datetime.now().strftime("%d.%m.%y")
+        self.old = (datetime.now() - timedelta(days=60)).strftime("%d.%m.%y")
+        self.start = datetime.now() - timedelta(days=7)
+
+    def test_counts_statuses_per_region(self):
+        """Test statuses are counted for the matching region only"""
+        values = _rows(
+            [self.today, "a", "77", "emp", "Хороший"],
+            [self.today, "b", "77", "emp", "block"],
+            [self.today, "c", "77", "emp", " Дефектный "],
+            [self.today, "d", "77", "emp", ""],
+            [self.today, "e", "50", "emp", "good"],
+        )
+
+        result = aggregate_statistics_by_region(values, 2, 4, self.start, ["77", "50"])
+
+        assert result["77"] == AccountStatistics(total=4, good=1, block=1, defect=1, no_status=1)
+        assert result["50"] == AccountStatistics(total=1, good=1)
+
+    def test_skips_old_rows_and_unknown_regions(self):
+        """Test rows outside period or region list are ignored"""
+        values = _rows(
+            [self.old, "a", "77", "emp", "good"],
+            [self.today, "b", "999", "emp", "good"],
+            ["", "c", "77", "emp", "good"],
+            [],
+        )
+
+        result = aggregate_statistics_by_region(values, 2, 4, self.start, ["77"])
+
+        assert result == {"77": AccountStatistics()}
+
+    def test_short_rows_count_as_no_status(self):
+        """Test rows without status column are counted as no_status"""
+        values = _rows([self.today, "a", "77"])
+
+        result = aggregate_statistics_by_region(values, 2, 4, self.start, ["77"])
+
+        assert result["77"] == AccountStatistics(total=1, no_status=1)
+
+
+class TestAggregateStatisticsWithRegions:
+    """Tests for aggregate_statistics_with_regions"""
+
+    def setup_method(self):
+        self.today = datetime.now().strftime("%d.%m.%y")
+        self.old = (datetime.now() - timedelta(days=60)).strftime("%d.%m.%y")
+        self.start = datetime.now() - timedelta(days=7)
+
+    def test_total_counts_rows_outside_region_list(self):
+        """Test total covers every row in period, per-region only listed regions"""
+        values = _rows(
+            [self.today, "a", "77", "emp", "good"],
+            [self.today, "b", "999", "emp", "block"],
+            [self.today, "c", "", "emp", ""],
+            [self.old, "d", "77", "emp", "good"],
+        )
+
+        total, by_region = aggregate_statistics_with_regions(values, 2, 4, self.start, ["77"])
+
+        assert total == AccountStatistics(total=3, good=1, block=1, no_status=1)
+        assert by_region == {"77": AccountStatistics(total=1, good=1)}
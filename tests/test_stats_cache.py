@@ -0,0 +1,96 @@
+"""
+Tests for statistics result cache.
+
+Run with: pytest tests/test_stats_cache.py -v
+"""
+
+from unittest.mock import patch
+
+from bot.services.stats_cache import (
+    STATS_CACHE_TTL,
+    STATS_TTL_BY_PERIOD,
+    StatsCache,
+    ttl_for_period,
+)
+
+
+class TestStatsCache:
+    """Tests for StatsCache TTL and LRU behaviour"""
+
+    def test_get_returns_stored_value(self):
+        """Test stored value is returned until TTL expires"""
+        cache = StatsCache(ttl=60.0)
+        cache.set("key", 42)
+
+        assert cache.get("key") == 42
+        assert cache.get("missing") is None
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_entry_expires_after_ttl(self):
+        """Test entry disappears after TTL"""
+        cache = StatsCache(ttl=10.0)
+        with patch("bot.services.stats_cache.time.monotonic", return_value=100.0):
+            cache.set("key", 42)
+        with patch("bot.services.stats_cache.time.monotonic", return_value=109.0):
+            assert cache.get("key") == 42
+        with patch("bot.services.stats_cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+
+    def test_least_recently_used_is_evicted(self):
+        """Test LRU eviction when cache is full"""
+        cache = StatsCache(ttl=60.0, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_invalidate_clears_all(self):
+        """Test invalidate drops every entry"""
+        cache = StatsCache()
+        cache.set("a", 1)
+        cache.invalidate()
+
+        assert cache.get("a") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_contains_does_not_touch_stats(self):
+        """Test contains checks freshness without counting hits/misses"""
+        cache = StatsCache(ttl=10.0)
+        with patch("bot.services.stats_cache.time.monotonic", return_value=100.0):
+            cache.set("key", 42)
+            assert cache.contains("key")
+            assert not cache.contains("missing")
+        with patch("bot.services.stats_cache.time.monotonic", return_value=110.0):
+            assert not cache.contains("key")
+
+        assert cache.get_stats()["hits"] == 0
+        assert cache.get_stats()["misses"] == 0
+
+    def test_set_with_custom_ttl(self):
+        """Test per-entry TTL overrides the cache default"""
+        cache = StatsCache(ttl=10.0)
+        with patch("bot.services.stats_cache.time.monotonic", return_value=100.0):
+            cache.set("short", 1)
+            cache.set("long", 2, ttl=300.0)
+        with patch("bot.services.stats_cache.time.monotonic", return_value=200.0):
+            assert cache.get("short") is None
+            assert cache.get("long") == 2
+
+    def test_get_returns_copy(self):
+        """Test mutating a returned value does not change the cached one"""
+        cache = StatsCache()
+        cache.set("key", {"77": 1})
+        cache.get("key")["77"] = 100
+
+        assert cache.get("key") == {"77": 1}
+
+    def test_ttl_for_period(self):
+        """Test period TTLs fall back to the default for unknown periods"""
+        assert ttl_for_period("day") == STATS_TTL_BY_PERIOD["day"]
+        assert ttl_for_period("month") == STATS_TTL_BY_PERIOD["month"]
+        assert ttl_for_period("unknown") == STATS_CACHE_TTL
@@ -0,0 +1,128 @@
+"""
+Tests for the outgoing Telegram rate limit middleware.
+
+Run with: pytest tests/test_throttling.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import EditMessageText, GetMe, SendMessage
+
+from bot.middlewares import throttling
+from bot.middlewares.throttling import TelegramRateLimitMiddleware
+
+
+class _Clock:
+    """Fake monotonic clock: sleep() advances time instantly and records the delay"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class _Request:
+    """Fake make_request: raises queued errors first, then returns "ok" """
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = []
+
+    async def __call__(self, bot, method):
+        self.calls.append(method)
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def _retry_after(method, seconds):
+    return TelegramRetryAfter(method=method, message="Too Many Requests", retry_after=seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(throttling, "time", clock)
+    monkeypatch.setattr(throttling, "asyncio", SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock))
+    return clock
+
+
+class TestPacing:
+    """Tests for message pacing"""
+
+    @pytest.mark.asyncio
+    async def test_messages_paced_at_25_per_second(self, clock):
+        """Test back-to-back sends and edits wait 1/25 s between each other"""
+        middleware = TelegramRateLimitMiddleware()
+        request = _Request()
+
+        await middleware(request, None, SendMessage(chat_id=1, text="a"))
+        await middleware(request, None, EditMessageText(chat_id=1, message_id=1, text="b"))
+        await middleware(request, None, SendMessage(chat_id=1, text="c"))
+
+        assert len(request.calls) == 3
+        assert clock.sleeps == pytest.approx([0.04, 0.04])
+
+    @pytest.mark.asyncio
+    async def test_no_wait_after_interval(self, clock):
+        """Test a send after the interval has passed does not wait"""
+        middleware = TelegramRateLimitMiddleware()
+        request = _Request()
+
+        await middleware(request, None, SendMessage(chat_id=1, text="a"))
+        clock.now += 1.0
+        await middleware(request, None, SendMessage(chat_id=1, text="b"))
+
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_other_methods_pass_through(self, clock):
+        """Test non-message methods are not paced"""
+        middleware = TelegramRateLimitMiddleware()
+        request = _Request()
+
+        await middleware(request, None, SendMessage(chat_id=1, text="a"))
+        assert await middleware(request, None, GetMe()) == "ok"
+        assert await middleware(request, None, GetMe()) == "ok"
+
+        assert len(request.calls) == 3
+        assert clock.sleeps == []
+
+
+class TestRetryAfter:
+    """Tests for TelegramRetryAfter handling"""
+
+    @pytest.mark.asyncio
+    async def test_retries_once_after_delay(self, clock):
+        """Test flood control waits retry_after and repeats the request"""
+        middleware = TelegramRateLimitMiddleware()
+        method = GetMe()
+        request = _Request(_retry_after(method, 3))
+
+        assert await middleware(request, None, method) == "ok"
+
+        assert request.calls == [method, method]
+        assert clock.sleeps == [3]
+
+    @pytest.mark.asyncio
+    async def test_second_failure_propagates(self, clock):
+        """Test the retry is made only once and its error is raised"""
+        middleware = TelegramRateLimitMiddleware()
+        method = SendMessage(chat_id=1, text="a")
+        request = _Request(_retry_after(method, 2), _retry_after(method, 5))
+
+        with pytest.raises(TelegramRetryAfter) as exc_info:
+            await middleware(request, None, method)
+
+        assert exc_info.value.retry_after == 5
+        assert len(request.calls) == 2
+        assert clock.sleeps == [2]